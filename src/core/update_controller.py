@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+import queue
 import threading
-from typing import Callable, Generic, TypeVar
+from typing import Awaitable, Callable, TypeVar
 
 from PySide6.QtCore import QObject, Signal
 
@@ -13,18 +15,25 @@ MAX_EXCHANGE_WORKERS = 4
 MAX_HTTP_CONCURRENCY = 4
 
 _EXECUTOR = ThreadPoolExecutor(max_workers=MAX_EXCHANGE_WORKERS)
-_HTTP_SEMAPHORE = threading.BoundedSemaphore(MAX_HTTP_CONCURRENCY)
+# Pre-filled token queue: SimpleQueue.get() takes a fast path while
+# tokens are available and only blocks once all slots are in use.
+_HTTP_SLOTS: queue.SimpleQueue[int] = queue.SimpleQueue()
+for _slot in range(MAX_HTTP_CONCURRENCY):
+    _HTTP_SLOTS.put(_slot)
+_ASYNC_HTTP_SEMAPHORE = asyncio.Semaphore(MAX_HTTP_CONCURRENCY)
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
 
 T = TypeVar("T")
 
 
-class UpdateJob(QObject, Generic[T]):
-    """Signals for a single update job."""
+class JobBus(QObject):
+    """Long-lived signals shared by all update jobs, keyed by job key."""
 
-    started = Signal(int)
-    succeeded = Signal(int, object)
-    failed = Signal(int, str)
-    finished = Signal(int)
+    started = Signal(str, int)
+    succeeded = Signal(str, int, object)
+    failed = Signal(str, int, str)
+    finished = Signal(str, int)
 
 
 class SafeUpdateController(QObject):
@@ -32,39 +41,69 @@ class SafeUpdateController(QObject):
 
     def __init__(self) -> None:
         super().__init__()
-        self._in_flight: set[str] = set()
-        self._lock = threading.Lock()
-
-    def submit(
-        self, key: str, run_id: int, task: Callable[[], T]
-    ) -> UpdateJob[T] | None:
-        with self._lock:
-            if key in self._in_flight:
-                return None
-            self._in_flight.add(key)
-        job: UpdateJob[T] = UpdateJob()
-        job.started.emit(run_id)
-
-        future = _EXECUTOR.submit(task)
-
-        def _done(fut) -> None:
-            try:
-                result = fut.result()
-            except Exception as exc:  # noqa: BLE001 - surface job failures
-                job.failed.emit(run_id, str(exc))
+        # Single dict operations are atomic under the GIL, so setdefault()
+        # acts as a compare-and-set on the key without an explicit lock.
+        self._in_flight: dict[str, object] = {}
+        self._bus = JobBus()
+
+    @property
+    def bus(self) -> JobBus:
+        """Signals for every submitted job; slots filter on the job key."""
+        return self._bus
+
+    def submit(self, key: str, run_id: int, task: Callable[[], T]) -> bool:
+        """Run ``task`` in the background unless ``key`` is already in flight."""
+        token = self._claim(key, run_id)
+        if token is None:
+            return False
+        self._track(key, run_id, token, _EXECUTOR.submit(task))
+        return True
+
+    def submit_async(
+        self, key: str, run_id: int, task: Callable[[], Awaitable[T]]
+    ) -> bool:
+        """Run the coroutine built by ``task`` on the shared I/O event loop."""
+        token = self._claim(key, run_id)
+        if token is None:
+            return False
+        self._track(key, run_id, token, submit_coro(task()))
+        return True
+
+    def clear_key(self, key: str) -> None:
+        self._in_flight.pop(key, None)
+
+    def _claim(self, key: str, run_id: int) -> object | None:
+        token = object()
+        if self._in_flight.setdefault(key, token) is not token:
+            return None
+        self._bus.started.emit(key, run_id)
+        return token
+
+    def _track(self, key: str, run_id: int, token: object, future: Future) -> None:
+        bus = self._bus
+
+        def _done(fut: Future) -> None:
+            exc, result = _future_snapshot(fut)
+            # Only release our own claim: after clear_key() a newer job may
+            # already hold this key.
+            if self._in_flight.get(key) is token:
+                self._in_flight.pop(key, None)
+            if exc is not None:
+                bus.failed.emit(key, run_id, str(exc))
             else:
-                job.succeeded.emit(run_id, result)
-            finally:
-                with self._lock:
-                    self._in_flight.discard(key)
-                job.finished.emit(run_id)
+                bus.succeeded.emit(key, run_id, result)
+            bus.finished.emit(key, run_id)
 
         future.add_done_callback(_done)
-        return job
 
-    def clear_key(self, key: str) -> None:
-        with self._lock:
-            self._in_flight.discard(key)
+
+def _future_snapshot(fut: Future) -> tuple[BaseException | None, object]:
+    """Return ``(exception, result)`` of a settled future."""
+    # The future is already done, so none of these calls block.
+    if fut.cancelled():
+        return CancelledError(), None
+    exc = fut.exception()
+    return exc, None if exc is not None else fut.result()
 
 
 _controller: SafeUpdateController | None = None
@@ -77,10 +116,33 @@ def get_update_controller() -> SafeUpdateController:
     return _controller
 
 
+def submit_coro(coro: Awaitable[T]) -> Future:
+    """Schedule ``coro`` on the shared I/O loop from any thread."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop())
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP  # noqa: PLW0603 - module-level singleton
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="update-io-loop", daemon=True
+            ).start()
+            _LOOP = loop
+    return _LOOP
+
+
 @contextmanager
 def http_slot():
-    _HTTP_SEMAPHORE.acquire()
+    token = _HTTP_SLOTS.get()
     try:
         yield
     finally:
-        _HTTP_SEMAPHORE.release()
+        _HTTP_SLOTS.put(token)
+
+
+@asynccontextmanager
+async def async_http_slot():
+    async with _ASYNC_HTTP_SEMAPHORE:
+        yield
@@ -0,0 +1,19 @@
+"""Wall-clock text shared by the GUI windows."""
+
+from __future__ import annotations
+
+import time
+
+_clock: tuple[int, str] = (-1, "")
+
+
+def now_text() -> str:
+    """Wall-clock HH:MM:SS, formatted at most once per second."""
+    global _clock  # noqa: PLW0603 - per-second cache shared by all windows
+    second = int(time.time())
+    clock = _clock
+    if clock[0] != second:
+        # Swapped as one tuple, so WS threads calling this concurrently
+        # never see a second paired with another second's text.
+        clock = _clock = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+    return clock[1]
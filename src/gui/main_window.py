@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+import sys
+import threading
+import time
+from typing import Callable
+
 from loguru import logger
-from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
-from PySide6.QtGui import QAction
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QAction, QColor, QPalette
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -22,7 +29,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .clock import now_text
 from .models.arbitrage_table_model import ArbitrageTableModel, OpportunityRow
+from .models.numeric_delegate import install_numeric_delegates
 from .models.quotes_table_model import QuotesTableModel
 from .scanner_window import ScannerWindow
 from .services.arbitrage_analyzer import ArbitrageResult, analyze
@@ -32,11 +41,27 @@ from .services.ws_manager import WsManager
 from .widgets.exchange_selector import ExchangeSelectorDialog
 from .widgets.log_panel import LogPanel
 
-
-class LogEmitter(QObject):
-    """Qt-friendly log emitter for loguru."""
-
-    message = Signal(str, str)
+EXCHANGE_KEYS = ("exchange", "exchange_name", "market", "name")
+BID_KEYS = ("bid", "bidPrice", "b")
+ASK_KEYS = ("ask", "askPrice", "a")
+LAST_KEYS = ("last", "price", "lastPrice", "c")
+ROLLUP_INTERVAL_NS = 5_000_000_000
+WARNING_STATUSES = frozenset(map(sys.intern, ("ERROR", "TIMEOUT", "NO_SYMBOL")))
+STATUS_COLORS = {
+    "IDLE": ("#1f2933", "#d9e2ec"),
+    "STARTING": ("#2d3748", "#fbd38d"),
+    "RUNNING": ("#22543d", "#f0fff4"),
+    "CONNECTED": ("#2f855a", "#f0fff4"),
+    "ERROR": ("#742a2a", "#fff5f5"),
+}
+NO_DATA_QUOTE = {
+    "bid": 0.0,
+    "ask": 0.0,
+    "last": 0.0,
+    "spread": 0.0,
+    "status": "ERROR",
+    "error": "No data",
+}
 
 
 class QuoteFetchSignals(QObject):
@@ -49,46 +74,156 @@ class QuoteFetchSignals(QObject):
 class WsQuoteSignals(QObject):
     """Signals for websocket quote updates."""
 
-    updated = Signal(dict)
+    batch_ready = Signal()
     error = Signal(str)
 
 
-class QuoteFetchWorker(QRunnable):
-    """Background worker for fetching quotes."""
+class QuoteFetchWorker(QObject):
+    """Fans quote fetch requests out to a thread pool from the GUI thread."""
+
+    FETCH_TIMEOUT = 15.0
+
+    def __init__(self, provider: CcxtPriceProvider, fallback: FakeQuoteService) -> None:
+        super().__init__()
+        self._provider = provider
+        self._fallback = fallback
+        self._pool = ThreadPoolExecutor(
+            max_workers=len(provider.supported_exchanges()),
+            thread_name_prefix="quote-fetch",
+        )
+        self.signals = QuoteFetchSignals()
+        self._batch: _QuoteBatch | None = None
+        # Requests are serialized by the caller, so one timer covers the
+        # batch currently in flight.
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.setInterval(int(self.FETCH_TIMEOUT * 1000))
+        self._timeout_timer.timeout.connect(self._expire_batch)
+        # Connected before any consumer, so the batch is released before a
+        # consumer's slot can queue the next request.
+        self.signals.finished.connect(self._release_batch)
+
+    @Slot(str, list)
+    def request(self, pair: str, exchanges: list[str]) -> None:
+        now = self._provider.poll_markets()
+        if not exchanges:
+            self.signals.finished.emit([])
+            return
+        # One task per exchange, so the batch takes as long as the slowest
+        # exchange rather than the sum of all of them. The last task to
+        # finish emits the batch; no thread sits blocked waiting on it.
+        # Single-exchange requests go through the pool too: this runs on the
+        # GUI thread, so fetching inline would block the UI on network I/O.
+        batch = _QuoteBatch(
+            exchanges,
+            self.signals.finished.emit,
+            partial(self._fallback_quotes, pair, exchanges),
+        )
+        self._batch = batch
+        self._timeout_timer.start()
+        for index, exchange in enumerate(exchanges):
+            future = self._pool.submit(self._provider.fetch_one, pair, exchange, now)
+            future.add_done_callback(partial(batch.complete, index))
+
+    def shutdown(self) -> None:
+        self._timeout_timer.stop()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fallback_quotes(
+        self, pair: str, exchanges: list[str], exc: BaseException
+    ) -> list[dict[str, object]]:
+        self.signals.error.emit(str(exc))
+        return self._fallback.generate(pair, exchanges)
+
+    @Slot(list)
+    def _release_batch(self, _quotes: list[dict[str, object]]) -> None:
+        """Runs on the GUI thread once a batch has been delivered."""
+        self._timeout_timer.stop()
+        self._batch = None
+
+    def _expire_batch(self) -> None:
+        # Expiring delivers synchronously and may queue the next request,
+        # so detach the batch first.
+        batch, self._batch = self._batch, None
+        if batch is not None:
+            batch.expire()
+
+
+class _QuoteBatch:
+    """Collects one quote per exchange and delivers them once, in order."""
 
     def __init__(
         self,
-        provider: CcxtPriceProvider,
-        fallback: FakeQuoteService,
-        pair: str,
         exchanges: list[str],
+        deliver: Callable[[list[dict[str, object]]], None],
+        fallback: Callable[[BaseException], list[dict[str, object]]],
     ) -> None:
-        super().__init__()
-        self._provider = provider
-        self._fallback = fallback
-        self._pair = pair
         self._exchanges = exchanges
-        self.signals = QuoteFetchSignals()
+        self._quotes: list[dict[str, object] | None] = [None] * len(exchanges)
+        self._remaining = len(exchanges)
+        self._deliver = deliver
+        self._fallback = fallback
+        self._raised = 0
+        self._done = False
+        self._lock = threading.Lock()
 
-    def run(self) -> None:
-        try:
-            quotes = self._provider.fetch_quotes(self._pair, self._exchanges)
-        except Exception as exc:
-            quotes = self._fallback.generate(self._pair, self._exchanges)
-            self.signals.error.emit(str(exc))
-        self.signals.finished.emit(quotes)
+    def complete(self, index: int, future: Future) -> None:
+        """Done callback; runs on the pool thread that finished the fetch."""
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            quote = {"exchange": self._exchanges[index], "status": "ERROR", "error": str(exc)}
+        else:
+            quote = future.result()
+        with self._lock:
+            if self._done:
+                return
+            self._quotes[index] = quote
+            self._remaining -= 1
+            if exc is not None:
+                self._raised += 1
+            if self._remaining:
+                return
+            self._done = True
+        if self._raised == len(self._exchanges):
+            # fetch_one reports exchange errors as quotes, so every task
+            # raising means the provider itself is broken: show fake quotes.
+            self._deliver(self._fallback(exc))
+            return
+        self._deliver(self._quotes)
+
+    def expire(self) -> None:
+        """Deliver what has arrived, marking the stragglers as timed out."""
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+            quotes = [
+                quote
+                if quote is not None
+                else {"exchange": exchange, "status": "TIMEOUT", "error": "Fetch timed out"}
+                for exchange, quote in zip(self._exchanges, self._quotes)
+            ]
+        self._deliver(quotes)
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    fetch_requested = Signal(str, list)
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("USDTUSDCEURI")
         self.resize(1200, 800)
         self._price_provider = CcxtPriceProvider()
         self._exchanges = self._price_provider.supported_exchanges()
-        self._selected_exchanges = set(self._exchanges)
+        self._selected_exchanges: frozenset[str] = frozenset(self._exchanges)
+        # Ordered snapshot handed to the fetch worker and WS manager as-is;
+        # it is replaced, never mutated, when the selection changes.
+        self._selected_exchanges_list: list[str] = list(self._exchanges)
+        self._sorted_exchanges: tuple[str, ...] = tuple(sorted(self._selected_exchanges))
         self._quote_service = FakeQuoteService()
         self._updates_count = 0
         self._errors_count = 0
@@ -96,22 +231,45 @@ class MainWindow(QMainWindow):
         self._last_requested_exchanges: list[str] = []
         self._last_requested_pair = ""
         self._log_single_fetch = False
-        self._last_rollup_log_at: datetime | None = None
+        self._last_rollup_ns: int | None = None
         self._status_by_exchange: dict[str, str] = {}
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
         self._timer.timeout.connect(self._refresh_quotes)
-        self._thread_pool = QThreadPool(self)
+        # Holding a spin box arrow fires valueChanged repeatedly; only the
+        # value that settles for 200 ms restarts the refresh timer.
+        self._interval_debounce = QTimer(self)
+        self._interval_debounce.setSingleShot(True)
+        self._interval_debounce.setInterval(200)
+        self._interval_debounce.timeout.connect(self._update_interval)
+        self._fetch_worker = QuoteFetchWorker(self._price_provider, self._quote_service)
+        self._fetch_worker.setParent(self)
+        self._fetch_worker.signals.finished.connect(self._handle_quotes)
+        self._fetch_worker.signals.error.connect(self._handle_fetch_error)
+        self.fetch_requested.connect(self._fetch_worker.request)
         self._fetch_in_progress = False
-        self._log_emitter = LogEmitter()
+        self._pending_request: tuple[str, list[str]] | None = None
+        self._log_buffer: deque[tuple[str, str]] = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
         self._ws_signals = WsQuoteSignals()
-        self._ws_signals.updated.connect(self._handle_ws_quote)
+        self._ws_signals.batch_ready.connect(self._schedule_ws_flush)
         self._ws_signals.error.connect(self._handle_ws_error)
         self._ws_manager = WsManager(
             price_provider=self._price_provider,
-            on_quote=self._ws_signals.updated.emit,
+            on_quote=self._buffer_ws_quote,
             on_error=self._ws_signals.error.emit,
         )
         self._quotes_by_exchange: dict[str, dict[str, object]] = {}
+        self._ws_buffer: dict[str, dict[str, object]] = {}
+        self._ws_buffer_lock = threading.Lock()
+        self._ws_batch_pending = False
+        self._quote_key_cache: dict[str, tuple[str, str, str]] = {}
+        self._ws_flush_timer = QTimer(self)
+        self._ws_flush_timer.setSingleShot(True)
+        self._ws_flush_timer.setInterval(50)
+        self._ws_flush_timer.timeout.connect(self._flush_ws_buffer)
         self._last_arbitrage_key: tuple[str, str] | None = None
         self._last_arbitrage_spread_pct: float | None = None
         self._scanner_window: ScannerWindow | None = None
@@ -148,7 +306,7 @@ class MainWindow(QMainWindow):
         self._interval_spin.setRange(250, 10000)
         self._interval_spin.setValue(1000)
         self._interval_spin.setSuffix(" ms")
-        self._interval_spin.valueChanged.connect(self._update_interval)
+        self._interval_spin.valueChanged.connect(lambda _value: self._interval_debounce.start())
 
         self._start_button = QPushButton("Start")
         self._stop_button = QPushButton("Stop")
@@ -161,6 +319,13 @@ class MainWindow(QMainWindow):
         self._status_label = QLabel("Idle")
         self._status_label.setAlignment(Qt.AlignCenter)
         self._status_label.setMinimumWidth(90)
+        self._status_label.setMargin(4)
+        self._status_label.setAutoFillBackground(True)
+        self._default_status_palette = self._status_label.palette()
+        self._status_palettes = {
+            status: self._make_status_palette(background, foreground)
+            for status, (background, foreground) in STATUS_COLORS.items()
+        }
 
         layout.addWidget(pair_label)
         layout.addWidget(self._pair_combo)
@@ -181,6 +346,7 @@ class MainWindow(QMainWindow):
         self._table_model = QuotesTableModel()
         self._table_view = QTableView()
         self._table_view.setModel(self._table_model)
+        install_numeric_delegates(self._table_view, QuotesTableModel.numeric_formats)
         self._table_view.setSortingEnabled(True)
         self._table_view.setAlternatingRowColors(True)
         self._table_view.horizontalHeader().setStretchLastSection(True)
@@ -241,6 +407,7 @@ class MainWindow(QMainWindow):
         self._arb_table_model = ArbitrageTableModel()
         self._arb_table_view = QTableView()
         self._arb_table_view.setModel(self._arb_table_model)
+        install_numeric_delegates(self._arb_table_view, ArbitrageTableModel.numeric_formats)
         self._arb_table_view.setAlternatingRowColors(True)
         self._arb_table_view.horizontalHeader().setStretchLastSection(True)
         self._arb_table_view.horizontalHeader().setDefaultSectionSize(140)
@@ -277,10 +444,20 @@ class MainWindow(QMainWindow):
     def _setup_logging(self) -> None:
         def sink(message: str) -> None:
             record = message.record
-            self._log_emitter.message.emit(record["level"].name, record["message"])
+            self._log_buffer.append((record["level"].name, record["message"]))
 
-        logger.add(sink, level="INFO")
-        self._log_emitter.message.connect(self._log_panel.append_log)
+        # enqueue=True runs the sink on loguru's writer thread, so callers
+        # never block on formatting. The sink only appends to a deque, which
+        # the GUI thread drains on a timer without any per-record signal.
+        self._log_sink_id = logger.add(sink, level="INFO", enqueue=True)
+        self._log_flush_timer.start()
+
+    def _flush_log_buffer(self) -> None:
+        buffer = self._log_buffer
+        if not buffer:
+            return
+        entries = [buffer.popleft() for _ in range(len(buffer))]
+        self._log_panel.append_log_batch(entries)
 
     def _open_scanner_window(self) -> None:
         if self._scanner_window is None:
@@ -297,18 +474,18 @@ class MainWindow(QMainWindow):
     def _start_stream(self) -> None:
         if self._timer.isActive():
             return
-        logger.info(
+        logger.opt(lazy=True).info(
             "Start clicked | symbol={} | exchanges={} | interval={} ms",
-            self._pair_combo.currentText(),
-            sorted(self._selected_exchanges),
-            self._interval_spin.value(),
+            self._pair_combo.currentText,
+            lambda: list(self._sorted_exchanges),
+            self._interval_spin.value,
         )
         has_ws = any(self._ws_manager.supports_exchange(exchange) for exchange in self._selected_exchanges)
         if has_ws:
             self._ensure_http_interval_for_ws()
         self._ws_manager.start_for_selected_exchanges(
             self._pair_combo.currentText(),
-            list(self._selected_exchanges),
+            self._selected_exchanges_list,
         )
         self._timer.start(self._interval_spin.value())
         self._start_button.setEnabled(False)
@@ -325,7 +502,7 @@ class MainWindow(QMainWindow):
         has_ws = any(self._ws_manager.supports_exchange(exchange) for exchange in self._selected_exchanges)
         if has_ws:
             self._ensure_http_interval_for_ws()
-        self._ws_manager.start_for_selected_exchanges(pair, list(self._selected_exchanges))
+        self._ws_manager.start_for_selected_exchanges(pair, self._selected_exchanges_list)
         self._set_status("STARTING" if has_ws else "RUNNING")
         self._refresh_quotes()
 
@@ -334,6 +511,9 @@ class MainWindow(QMainWindow):
             return
         self._ws_manager.stop_all()
         self._timer.stop()
+        self._ws_flush_timer.stop()
+        self._take_ws_buffer()
+        self._pending_request = None
         self._start_button.setEnabled(True)
         self._start_button.setText("Start")
         self._stop_button.setEnabled(False)
@@ -346,55 +526,82 @@ class MainWindow(QMainWindow):
         logger.info("Manual refresh triggered (Binance)")
 
     def _refresh_quotes(self, exchanges: list[str] | None = None) -> None:
+        pair = self._pair_combo.currentText()
+        exchanges = exchanges or self._selected_exchanges_list
         if self._fetch_in_progress:
+            # Latest wins: keep only the newest request and send it as soon
+            # as the in-flight fetch completes.
+            self._pending_request = (pair, exchanges)
             return
-        pair = self._pair_combo.currentText()
-        exchanges = exchanges or list(self._selected_exchanges)
+        self._dispatch_fetch(pair, exchanges)
+
+    def _dispatch_fetch(self, pair: str, exchanges: list[str]) -> None:
         self._last_requested_pair = pair
         self._last_requested_exchanges = exchanges
-        self._updates_count += 1
         self._fetch_in_progress = True
-        worker = QuoteFetchWorker(self._price_provider, self._quote_service, pair, exchanges)
-        worker.signals.finished.connect(self._handle_quotes)
-        worker.signals.error.connect(self._handle_fetch_error)
-        self._thread_pool.start(worker)
+        self.fetch_requested.emit(pair, exchanges)
 
     def _handle_quotes(self, quotes: list[dict[str, object]]) -> None:
-        normalized = self._normalize_quotes(quotes, self._last_requested_exchanges)
+        timestamp = now_text()
+        normalized = self._normalize_quotes(quotes, self._last_requested_exchanges, timestamp)
         if self._log_single_fetch:
-            statuses = [str(item.get("status", "")) for item in normalized]
-            has_numbers = any(
-                float(item.get("bid", 0.0)) or float(item.get("ask", 0.0)) or float(item.get("last", 0.0))
-                for item in normalized
+            logger.opt(lazy=True).info(
+                "Test 1 fetch result | status={} | has_numbers={}",
+                lambda: [item["status"] for item in normalized],
+                lambda: any(item["bid"] or item["ask"] or item["last"] for item in normalized),
             )
-            logger.info("Test 1 fetch result | status={} | has_numbers={}", statuses, has_numbers)
             self._log_single_fetch = False
-        self._log_status_changes(normalized)
-        self._log_rollup(normalized)
+        self._aggregate_statuses(normalized)
         self._table_model.update_quotes(normalized)
-        self._cache_quotes(normalized)
         self._update_arbitrage()
-        self._errors_count = sum(
-            1 for quote in normalized if str(quote.get("status", "")).lower() in {"error", "no_symbol"}
-        )
-        self._last_update = datetime.now().strftime("%H:%M:%S")
+        self._updates_count += 1
+        self._last_update = timestamp
         self._update_counters()
         self._fetch_in_progress = False
+        pending = self._pending_request
+        if pending is not None:
+            self._pending_request = None
+            self._dispatch_fetch(*pending)
 
     def _handle_fetch_error(self, message: str) -> None:
         logger.warning("Falling back to fake quotes: {}", message)
 
-    def _handle_ws_quote(self, quote: dict[str, object]) -> None:
-        if not self._timer.isActive():
+    def _buffer_ws_quote(self, quote: dict[str, object]) -> None:
+        """Called on provider threads; wakes the GUI thread once per batch."""
+        exchange = str(quote.get("exchange") or "")
+        if not exchange:
+            return
+        with self._ws_buffer_lock:
+            self._ws_buffer[exchange] = quote
+            if self._ws_batch_pending:
+                return
+            self._ws_batch_pending = True
+        self._ws_signals.batch_ready.emit()
+
+    def _take_ws_buffer(self) -> list[dict[str, object]]:
+        with self._ws_buffer_lock:
+            buffer = self._ws_buffer
+            self._ws_buffer = {}
+            self._ws_batch_pending = False
+        return list(buffer.values())
+
+    def _schedule_ws_flush(self) -> None:
+        if not self._ws_flush_timer.isActive():
+            self._ws_flush_timer.start()
+
+    def _flush_ws_buffer(self) -> None:
+        raw_quotes = self._take_ws_buffer()
+        if not raw_quotes or not self._timer.isActive():
             return
+        timestamp = now_text()
+        quotes = [self._normalize_quote_item(quote, timestamp) for quote in raw_quotes]
         if self._status_label.text() == "STARTING":
             self._set_status("CONNECTED")
-        normalized = self._normalize_quote_item(quote)
-        self._table_model.update_exchange_quote(normalized)
-        if normalized.get("exchange"):
-            self._quotes_by_exchange[str(normalized.get("exchange", ""))] = normalized
+        self._table_model.update_exchange_quotes(quotes)
+        for quote in quotes:
+            self._quotes_by_exchange[quote["exchange"]] = quote
         self._update_arbitrage()
-        self._last_update = datetime.now().strftime("%H:%M:%S")
+        self._last_update = timestamp
         self._update_counters()
 
     def _handle_ws_error(self, _message: str) -> None:
@@ -408,7 +615,16 @@ class MainWindow(QMainWindow):
     def _open_exchange_dialog(self) -> None:
         dialog = ExchangeSelectorDialog(self._exchanges, self._selected_exchanges, self)
         if dialog.exec():
-            self._selected_exchanges = set(dialog.selected_exchanges())
+            self._selected_exchanges = frozenset(dialog.selected_exchanges())
+            self._selected_exchanges_list = [
+                exchange for exchange in self._exchanges if exchange in self._selected_exchanges
+            ]
+            self._sorted_exchanges = tuple(sorted(self._selected_exchanges))
+            self._quotes_by_exchange = {
+                exchange: quote
+                for exchange, quote in self._quotes_by_exchange.items()
+                if exchange in self._selected_exchanges
+            }
             self._exchange_summary.setText(self._exchange_summary_text())
             logger.info("Selected {} exchanges", len(self._selected_exchanges))
             self._refresh_quotes()
@@ -421,132 +637,128 @@ class MainWindow(QMainWindow):
         self,
         quotes: list[dict[str, object]],
         exchanges: list[str],
+        timestamp: str,
     ) -> list[dict[str, object]]:
-        normalized: list[dict[str, object]] = []
-        for item in quotes:
-            normalized.append(self._normalize_quote_item(item))
-
-        if not normalized:
-            return [
-                {
-                    "exchange": exchange,
-                    "bid": 0.0,
-                    "ask": 0.0,
-                    "last": 0.0,
-                    "spread": 0.0,
-                    "timestamp": datetime.now().strftime("%H:%M:%S"),
-                    "status": "ERROR",
-                    "error": "No data",
-                }
-                for exchange in exchanges
-            ]
-
-        seen = {str(item.get("exchange", "")) for item in normalized}
+        normalized = [self._normalize_quote_item(item, timestamp) for item in quotes]
+        # Fetch and fallback paths return one quote per requested exchange in
+        # request order, so the common case needs no membership set at all.
+        if len(normalized) == len(exchanges) and all(
+            item["exchange"] == exchange for item, exchange in zip(normalized, exchanges)
+        ):
+            return normalized
+        seen = {item["exchange"] for item in normalized}
         missing = [exchange for exchange in exchanges if exchange not in seen]
         if missing:
-            timestamp = datetime.now().strftime("%H:%M:%S")
             normalized.extend(
-                {
-                    "exchange": exchange,
-                    "bid": 0.0,
-                    "ask": 0.0,
-                    "last": 0.0,
-                    "spread": 0.0,
-                    "timestamp": timestamp,
-                    "status": "ERROR",
-                    "error": "No data",
-                }
-                for exchange in missing
+                {**NO_DATA_QUOTE, "exchange": exchange, "timestamp": timestamp} for exchange in missing
             )
         return normalized
 
-    def _normalize_quote_item(self, item: dict[str, object]) -> dict[str, object]:
-        exchange = (
-            item.get("exchange")
-            or item.get("exchange_name")
-            or item.get("market")
-            or item.get("name")
-            or ""
-        )
-        bid = item.get("bid")
-        if bid is None:
-            bid = item.get("bidPrice") or item.get("b")
-        ask = item.get("ask")
-        if ask is None:
-            ask = item.get("askPrice") or item.get("a")
-        last = item.get("last")
-        if last is None:
-            last = item.get("price") or item.get("lastPrice") or item.get("c")
-        spread = item.get("spread")
+    def _normalize_quote_item(self, item: dict[str, object], now: str) -> dict[str, object]:
+        get = item.get
+        # Interned names make the per-exchange dict lookups and status
+        # comparisons downstream hit CPython's identity fast path.
+        exchange = sys.intern(str(_first_entry(get, EXCHANGE_KEYS)[1] or ""))
+        bid, ask, last = self._price_fields(exchange, get)
+        bid_value = _to_float(bid)
+        ask_value = _to_float(ask)
+        spread = get("spread")
         if spread is None and bid is not None and ask is not None:
-            try:
-                spread = float(ask) - float(bid)
-            except (TypeError, ValueError):
-                spread = 0.0
-        timestamp = item.get("timestamp") or item.get("time") or datetime.now().strftime("%H:%M:%S")
-        status = item.get("status") or item.get("state") or "ERROR"
-        source = item.get("source") or "HTTP"
+            spread = ask_value - bid_value
+        timestamp = get("timestamp") or get("time") or now
+        status = sys.intern(str(get("status") or get("state") or "ERROR").upper())
+        source = get("source") or "HTTP"
         return {
-            "exchange": str(exchange),
-            "bid": float(bid or 0.0),
-            "ask": float(ask or 0.0),
-            "last": float(last or 0.0),
-            "spread": float(spread or 0.0),
+            "exchange": exchange,
+            "bid": bid_value,
+            "ask": ask_value,
+            "last": _to_float(last),
+            "spread": _to_float(spread),
             "timestamp": str(timestamp),
-            "status": str(status),
+            "status": status,
             "source": str(source),
-            "error": item.get("error"),
+            "error": get("error"),
         }
 
+    def _price_fields(
+        self, exchange: str, get: Callable[[str], object]
+    ) -> tuple[object, object, object]:
+        # Each source keeps the same payload shape, so remember which keys
+        # matched for an exchange and read them directly on later ticks.
+        keys = self._quote_key_cache.get(exchange)
+        if keys is not None:
+            bid_key, ask_key, last_key = keys
+            bid, ask, last = get(bid_key), get(ask_key), get(last_key)
+            if bid is not None and ask is not None and last is not None:
+                return bid, ask, last
+        bid_key, bid = _first_entry(get, BID_KEYS)
+        ask_key, ask = _first_entry(get, ASK_KEYS)
+        last_key, last = _first_entry(get, LAST_KEYS)
+        if exchange and bid_key and ask_key and last_key:
+            self._quote_key_cache[exchange] = (bid_key, ask_key, last_key)
+        return bid, ask, last
+
     def _update_counters(self) -> None:
         self._active_label.setText(f"Active exchanges: {len(self._selected_exchanges)}")
         self._updates_label.setText(f"Updates: {self._updates_count}")
         self._errors_label.setText(f"Errors: {self._errors_count}")
         self._last_update_label.setText(f"Last update: {self._last_update}")
 
-    def _log_rollup(self, quotes: list[dict[str, object]]) -> None:
-        now = datetime.now()
-        if self._last_rollup_log_at and (now - self._last_rollup_log_at).total_seconds() < 5:
-            return
+    def _aggregate_statuses(self, quotes: list[dict[str, object]]) -> None:
+        """Count statuses, log changes and refresh the quote cache in one pass."""
         ok_count = 0
         no_symbol_count = 0
         error_count = 0
+        timeout_count = 0
+        status_by_exchange = self._status_by_exchange
+        previous_status = status_by_exchange.get
+        cache = self._quotes_by_exchange
         for quote in quotes:
-            status = str(quote.get("status", "")).upper()
+            status = quote["status"]
             if status == "OK":
                 ok_count += 1
             elif status == "NO_SYMBOL":
                 no_symbol_count += 1
-            elif status in {"ERROR", "TIMEOUT"}:
+            elif status == "ERROR":
                 error_count += 1
+            elif status == "TIMEOUT":
+                timeout_count += 1
+            exchange = quote["exchange"]
+            if not exchange:
+                continue
+            cache[exchange] = quote
+            previous = previous_status(exchange)
+            if previous != status:
+                status_by_exchange[exchange] = status
+                self._log_status_change(exchange, previous, status, quote)
+        self._errors_count = error_count + no_symbol_count
+        self._log_rollup(ok_count, no_symbol_count, error_count + timeout_count)
+
+    def _log_rollup(self, ok_count: int, no_symbol_count: int, error_count: int) -> None:
+        now_ns = time.monotonic_ns()
+        if self._last_rollup_ns is not None and now_ns - self._last_rollup_ns < ROLLUP_INTERVAL_NS:
+            return
         logger.info(
             "Quote summary | OK={} | NO_SYMBOL={} | ERROR/TIMEOUT={}",
             ok_count,
             no_symbol_count,
             error_count,
         )
-        self._last_rollup_log_at = now
+        self._last_rollup_ns = now_ns
 
-    def _log_status_changes(self, quotes: list[dict[str, object]]) -> None:
-        for quote in quotes:
-            exchange = str(quote.get("exchange", ""))
-            status = str(quote.get("status", ""))
-            if not exchange:
-                continue
-            previous = self._status_by_exchange.get(exchange)
-            if previous == status:
-                continue
-            self._status_by_exchange[exchange] = status
-            message = str(quote.get("error") or "")
-            if status.upper() in {"ERROR", "TIMEOUT", "NO_SYMBOL"}:
-                logger.warning("Status change | {}: {} -> {} | {}", exchange, previous, status, message)
-            else:
-                logger.info("Status change | {}: {} -> {} | {}", exchange, previous, status, message)
-
-    def _cache_quotes(self, quotes: list[dict[str, object]]) -> None:
-        self._quotes_by_exchange = {
-            str(quote.get("exchange", "")): quote for quote in quotes if str(quote.get("exchange", ""))
-        }
+    def _log_status_change(
+        self, exchange: str, previous: str | None, status: str, quote: dict[str, object]
+    ) -> None:
+        emit = logger.warning if status in WARNING_STATUSES else logger.info
+        # loguru only formats arguments for records that pass a sink, so the
+        # error object is stringified lazily without allocating closures.
+        emit(
+            "Status change | {}: {} -> {} | {}",
+            exchange,
+            previous,
+            status,
+            quote.get("error") or "",
+        )
 
     def _update_arbitrage(self) -> None:
         if not hasattr(self, "_arb_table_model"):
@@ -607,16 +819,23 @@ class MainWindow(QMainWindow):
             self._last_arbitrage_key = key
             self._last_arbitrage_spread_pct = spread_pct
 
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        self._stop_stream()
+        self._fetch_worker.shutdown()
+        self._price_provider.close()
+        logger.remove(self._log_sink_id)
+        super().closeEvent(event)
+
     def _set_status(self, status: str) -> None:
-        styles = {
-            "IDLE": "background-color: #1f2933; color: #d9e2ec; padding: 4px; border-radius: 4px;",
-            "STARTING": "background-color: #2d3748; color: #fbd38d; padding: 4px; border-radius: 4px;",
-            "RUNNING": "background-color: #22543d; color: #f0fff4; padding: 4px; border-radius: 4px;",
-            "CONNECTED": "background-color: #2f855a; color: #f0fff4; padding: 4px; border-radius: 4px;",
-            "ERROR": "background-color: #742a2a; color: #fff5f5; padding: 4px; border-radius: 4px;",
-        }
         self._status_label.setText(status)
-        self._status_label.setStyleSheet(styles.get(status, ""))
+        # Swapping prebuilt palettes avoids re-parsing a stylesheet per change.
+        self._status_label.setPalette(self._status_palettes.get(status, self._default_status_palette))
+
+    def _make_status_palette(self, background: str, foreground: str) -> QPalette:
+        palette = QPalette(self._status_label.palette())
+        palette.setColor(QPalette.Window, QColor(background))
+        palette.setColor(QPalette.WindowText, QColor(foreground))
+        return palette
 
     def _ensure_http_interval_for_ws(self) -> None:
         if self._interval_spin.value() < 5000:
@@ -631,3 +850,19 @@ class MainWindow(QMainWindow):
             "About",
             "USDTUSDCEURI\nGUI scaffold for price sniffing and analytics.",
         )
+
+
+def _first_entry(get: Callable[[str], object], keys: tuple[str, ...]) -> tuple[str | None, object]:
+    """Return the first ``(key, value)`` in ``keys`` whose value is not None."""
+    for key in keys:
+        value = get(key)
+        if value is not None:
+            return key, value
+    return None, None
+
+
+def _to_float(value: object) -> float:
+    """Convert a raw quote field, skipping the call when it is already a float."""
+    if type(value) is float:
+        return value
+    return float(value) if value else 0.0
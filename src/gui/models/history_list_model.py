@@ -0,0 +1,45 @@
+"""List model for a bounded, newest-first history of text lines."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class HistoryListModel(QAbstractListModel):
+    """Qt list model over a fixed-size ring buffer of lines, newest first."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self._limit = limit
+        self._lines: deque[str] = deque(maxlen=limit)
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        return len(self._lines)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role != Qt.DisplayRole:
+            return None
+        row_index = index.row()
+        if row_index < 0:
+            return None
+        try:
+            return self._lines[row_index]
+        except IndexError:
+            return None
+
+    def add_line(self, line: str) -> None:
+        """Prepend ``line``, dropping the oldest one once the buffer is full."""
+        if len(self._lines) == self._limit:
+            last = self._limit - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self._lines.pop()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._lines.appendleft(line)
+        self.endInsertRows()
+
+    def line(self, row: int) -> str:
+        return self._lines[row]
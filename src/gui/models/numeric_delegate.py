@@ -0,0 +1,63 @@
+"""Item delegate that formats numeric cells at paint time."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from PySide6.QtCore import QLocale
+from PySide6.QtWidgets import QAbstractItemView, QStyledItemDelegate
+
+
+def _make_locale(grouped: bool) -> QLocale:
+    locale = QLocale(QLocale.Language.English, QLocale.Country.UnitedStates)
+    if not grouped:
+        locale.setNumberOptions(QLocale.NumberOption.OmitGroupSeparator)
+    return locale
+
+
+# Fixed locales keep the "1234.500000" / "1,235" output independent of the
+# user's system locale.
+_PLAIN_LOCALE = _make_locale(grouped=False)
+_GROUPED_LOCALE = _make_locale(grouped=True)
+
+
+@dataclass(frozen=True, slots=True)
+class NumericFormat:
+    """Fixed-point display format for a numeric column."""
+
+    decimals: int
+    suffix: str = ""
+    grouped: bool = False
+
+
+PRICE_FORMAT = NumericFormat(6)
+PERCENT_FORMAT = NumericFormat(4, "%")
+
+
+class NumericDelegate(QStyledItemDelegate):
+    """Render float cell values with QLocale instead of in the model."""
+
+    def __init__(self, number_format: NumericFormat, parent: QAbstractItemView | None = None) -> None:
+        super().__init__(parent)
+        self._decimals = number_format.decimals
+        self._suffix = number_format.suffix
+        self._locale = _GROUPED_LOCALE if number_format.grouped else _PLAIN_LOCALE
+
+    def displayText(self, value: Any, locale: QLocale) -> str:  # type: ignore[override]
+        if isinstance(value, float):
+            return self._locale.toString(value, "f", self._decimals) + self._suffix
+        return super().displayText(value, locale)
+
+
+def install_numeric_delegates(
+    view: QAbstractItemView, formats: Mapping[int, NumericFormat]
+) -> None:
+    """Attach one shared delegate per distinct format to the given columns."""
+    delegates: dict[NumericFormat, NumericDelegate] = {}
+    for column, number_format in formats.items():
+        delegate = delegates.get(number_format)
+        if delegate is None:
+            delegate = NumericDelegate(number_format, view)
+            delegates[number_format] = delegate
+        view.setItemDelegateForColumn(column, delegate)
@@ -3,12 +3,34 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
+import sys
 from typing import Any
 
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
-
-
-@dataclass(frozen=True)
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtGui import QBrush
+
+from .numeric_delegate import PRICE_FORMAT, NumericFormat
+from .row_ranges import contiguous_runs
+from .row_table_model import CHANGED_ROLES, RowTableModel
+
+_STATUS_BRUSHES = {
+    status: QBrush(color)
+    for name, color in (
+        ("ok", Qt.GlobalColor.darkGreen),
+        ("warning", Qt.GlobalColor.darkYellow),
+        ("error", Qt.GlobalColor.darkRed),
+    )
+    for status in (name, name.upper())
+}
+_DEFAULT_STATUS_BRUSH = QBrush(Qt.GlobalColor.black)
+_COLUMN_FIELDS = ("exchange", "bid", "ask", "last", "spread", "timestamp", "status")
+_SORT_KEYS = {column: attrgetter(field) for column, field in enumerate(_COLUMN_FIELDS)}
+# Numeric cells stay floats; NumericDelegate formats them at paint time.
+_ROW_VALUES = attrgetter(*_COLUMN_FIELDS)
+
+
+@dataclass(slots=True)
 class QuoteRow:
     """Container for a single quote row."""
 
@@ -21,7 +43,7 @@ class QuoteRow:
     status: str
 
 
-class QuotesTableModel(QAbstractTableModel):
+class QuotesTableModel(RowTableModel):
     """Qt table model for quote rows."""
 
     _headers = [
@@ -33,144 +55,127 @@ class QuotesTableModel(QAbstractTableModel):
         "Timestamp",
         "Status",
     ]
+    _right_aligned_columns = frozenset({1, 2, 3, 4})
+
+    numeric_formats: dict[int, NumericFormat] = {
+        1: PRICE_FORMAT,
+        2: PRICE_FORMAT,
+        3: PRICE_FORMAT,
+        4: PRICE_FORMAT,
+    }
 
     def __init__(self) -> None:
         super().__init__()
         self._rows: list[QuoteRow] = []
+        self._display: list[tuple[Any, ...]] = []
+        self._row_index: dict[str, int] = {}
+        self._last_column = len(self._headers) - 1
 
-    def rowCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
-        return len(self._rows)
-
-    def columnCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
-        return len(self._headers)
-
-    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
-        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
-            return None
-
-        row = self._rows[index.row()]
-        column = index.column()
-
-        if role == Qt.DisplayRole:
-            return self._format_display(row, column)
-
-        if role == Qt.TextAlignmentRole:
-            if column in {1, 2, 3, 4}:
-                return int(Qt.AlignRight | Qt.AlignVCenter)
-            return int(Qt.AlignLeft | Qt.AlignVCenter)
-
-        if role == Qt.ForegroundRole and column == 6:
-            return self._status_color(row.status)
+    def _display_row(self, row_index: int) -> tuple[Any, ...]:
+        return self._display[row_index]
 
-        return None
-
-    def headerData(
-        self,
-        section: int,
-        orientation: Qt.Orientation,
-        role: int = Qt.DisplayRole,
-    ) -> Any:  # type: ignore[override]
-        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+    def _foreground(self, row_index: int, column: int) -> QBrush | None:
+        if column != 6:
             return None
-        if 0 <= section < len(self._headers):
-            return self._headers[section]
-        return None
+        return self._status_color(self._rows[row_index].status)
 
     def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:  # type: ignore[override]
         if not self._rows:
             return
-        key_funcs = {
-            0: lambda row: row.exchange,
-            1: lambda row: row.bid,
-            2: lambda row: row.ask,
-            3: lambda row: row.last,
-            4: lambda row: row.spread,
-            5: lambda row: row.timestamp,
-            6: lambda row: row.status,
-        }
-        key_func = key_funcs.get(column, lambda row: row.exchange)
+        key_func = _SORT_KEYS.get(column, _SORT_KEYS[0])
         reverse = order == Qt.SortOrder.DescendingOrder
         self.layoutAboutToBeChanged.emit()
         self._rows.sort(key=key_func, reverse=reverse)
+        self._display = [_ROW_VALUES(row) for row in self._rows]
+        self._reindex()
         self.layoutChanged.emit()
 
     def update_quotes(self, quotes: list[dict[str, Any]]) -> None:
-        """Replace the table rows with new quote dictionaries."""
-        self.beginResetModel()
-        self._rows = [
-            QuoteRow(
-                exchange=str(item.get("exchange", "")),
-                bid=float(item.get("bid", 0.0)),
-                ask=float(item.get("ask", 0.0)),
-                last=float(item.get("last", 0.0)),
-                spread=float(item.get("spread", 0.0)),
-                timestamp=str(item.get("timestamp", "")),
-                status=str(item.get("status", "")),
-            )
-            for item in quotes
-        ]
-        self.endResetModel()
+        """Diff new quotes into the table, touching only rows that changed."""
+        incoming = [self._quote_values(item) for item in quotes]
+        exchanges = {values[0] for values in incoming}
+        stale = [index for index, row in enumerate(self._rows) if row.exchange not in exchanges]
+        if stale:
+            for first, last in reversed(contiguous_runs(stale)):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self._rows[first : last + 1]
+                del self._display[first : last + 1]
+                self.endRemoveRows()
+            self._reindex()
+        self._store_batch(incoming)
 
     def update_exchange_quote(self, quote: dict[str, Any]) -> None:
         """Update a single exchange row with new quote data."""
-        exchange = str(quote.get("exchange", ""))
-        if not exchange:
-            return
-        for index, row in enumerate(self._rows):
-            if row.exchange != exchange:
-                continue
-            self._rows[index] = QuoteRow(
-                exchange=exchange,
-                bid=float(quote.get("bid", 0.0)),
-                ask=float(quote.get("ask", 0.0)),
-                last=float(quote.get("last", 0.0)),
-                spread=float(quote.get("spread", 0.0)),
-                timestamp=str(quote.get("timestamp", "")),
-                status=str(quote.get("status", "")),
-            )
-            top_left = self.index(index, 0)
-            bottom_right = self.index(index, self.columnCount() - 1)
-            self.dataChanged.emit(top_left, bottom_right)
+        if not quote.get("exchange"):
             return
+        index = self._store_values(self._quote_values(quote))
+        if index is not None:
+            self._emit_rows_changed(index, index)
+
+    def update_exchange_quotes(self, quotes: list[dict[str, Any]]) -> None:
+        """Apply a batch of per-exchange quote updates with one dataChanged."""
+        self._store_batch(
+            [self._quote_values(quote) for quote in quotes if quote.get("exchange")]
+        )
+
+    def _store_batch(self, batch: list[tuple[Any, ...]]) -> None:
+        changed: list[int] = []
+        for values in batch:
+            index = self._store_values(values)
+            if index is not None:
+                changed.append(index)
+        if changed:
+            self._emit_rows_changed(min(changed), max(changed))
+
+    def _store_values(self, values: tuple[Any, ...]) -> int | None:
+        """Insert or update a row in place; return its index if an existing row changed."""
+        exchange = values[0]
+        index = self._row_index.get(exchange)
+        if index is None:
+            position = len(self._rows)
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._rows.append(QuoteRow(*values))
+            self._display.append(values)
+            self._row_index[exchange] = position
+            self.endInsertRows()
+            return None
+        # The display tuple mirrors the row's fields, so it doubles as the
+        # previous state; steady-state refreshes allocate no new rows.
+        if self._display[index] == values:
+            return None
+        row = self._rows[index]
+        (row.bid, row.ask, row.last, row.spread, row.timestamp, row.status) = values[1:]
+        self._display[index] = values
+        return index
+
+    def _emit_rows_changed(self, first: int, last: int) -> None:
+        self.dataChanged.emit(
+            self.createIndex(first, 0),
+            self.createIndex(last, self._last_column),
+            CHANGED_ROLES,
+        )
+
+    def _reindex(self) -> None:
+        self._row_index = {row.exchange: index for index, row in enumerate(self._rows)}
 
-        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows))
-        self._rows.append(
-            QuoteRow(
-                exchange=exchange,
-                bid=float(quote.get("bid", 0.0)),
-                ask=float(quote.get("ask", 0.0)),
-                last=float(quote.get("last", 0.0)),
-                spread=float(quote.get("spread", 0.0)),
-                timestamp=str(quote.get("timestamp", "")),
-                status=str(quote.get("status", "")),
-            )
+    @staticmethod
+    def _quote_values(quote: dict[str, Any]) -> tuple[Any, ...]:
+        """Return the row fields of ``quote`` in column order."""
+        get = quote.get
+        return (
+            sys.intern(str(get("exchange", ""))),
+            float(get("bid", 0.0)),
+            float(get("ask", 0.0)),
+            float(get("last", 0.0)),
+            float(get("spread", 0.0)),
+            str(get("timestamp", "")),
+            str(get("status", "")),
         )
-        self.endInsertRows()
-
-    def _format_display(self, row: QuoteRow, column: int) -> str:
-        if column == 0:
-            return row.exchange
-        if column == 1:
-            return f"{row.bid:.6f}"
-        if column == 2:
-            return f"{row.ask:.6f}"
-        if column == 3:
-            return f"{row.last:.6f}"
-        if column == 4:
-            return f"{row.spread:.6f}"
-        if column == 5:
-            return row.timestamp
-        if column == 6:
-            return row.status
-        return ""
 
     @staticmethod
-    def _status_color(status: str):
-        normalized = status.lower()
-        if normalized == "ok":
-            return Qt.GlobalColor.darkGreen
-        if normalized == "warning":
-            return Qt.GlobalColor.darkYellow
-        if normalized == "error":
-            return Qt.GlobalColor.darkRed
-        return Qt.GlobalColor.black
+    def _status_color(status: str) -> QBrush:
+        brush = _STATUS_BRUSHES.get(status)
+        if brush is None:
+            brush = _STATUS_BRUSHES.get(status.lower(), _DEFAULT_STATUS_BRUSH)
+        return brush
+
@@ -0,0 +1,16 @@
+"""Helpers for grouping table rows into change ranges."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+
+def contiguous_runs(indices: Iterable[int]) -> list[tuple[int, int]]:
+    """Collapse sorted row indices into ``(first, last)`` runs."""
+    runs: list[tuple[int, int]] = []
+    for index in indices:
+        if runs and runs[-1][1] == index - 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
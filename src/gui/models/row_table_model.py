@@ -0,0 +1,103 @@
+"""Base table model serving display, alignment and foreground per row."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QModelRoleDataSpan, Qt
+from PySide6.QtGui import QBrush
+
+ALIGN_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+ALIGN_LEFT = int(Qt.AlignLeft | Qt.AlignVCenter)
+DISPLAY_ROLE = int(Qt.DisplayRole)
+ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+FOREGROUND_ROLE = int(Qt.ForegroundRole)
+CHANGED_ROLES = [Qt.DisplayRole, Qt.ForegroundRole]
+
+
+class RowTableModel(QAbstractTableModel):
+    """Qt table model over ``_rows`` with one display tuple per row.
+
+    Subclasses set ``_headers`` and ``_right_aligned_columns`` and implement
+    ``_display_row``; ``_foreground`` is optional.
+    """
+
+    _headers: list[str] = []
+    _right_aligned_columns: frozenset[int] = frozenset()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rows: list[Any] = []
+        self._role_handlers: dict[int, Callable[[int, int], Any]] = {
+            DISPLAY_ROLE: self._display_data,
+            ALIGNMENT_ROLE: self._alignment_data,
+            FOREGROUND_ROLE: self._foreground,
+        }
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        return len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        # Unhandled roles exit on one dict miss. Qt only asks for indices it
+        # got from index(), so a failed lookup is the rare case; only the
+        # invalid index (row -1) needs a guard as negative indices wrap.
+        handler = self._role_handlers.get(role)
+        if handler is None:
+            return None
+        row_index = index.row()
+        if row_index < 0:
+            return None
+        try:
+            return handler(row_index, index.column())
+        except IndexError:
+            return None
+
+    def multiData(self, index: QModelIndex, roleDataSpan: QModelRoleDataSpan) -> None:  # type: ignore[override]
+        """Fill every role the view asks for in one call per cell."""
+        row_index = index.row()
+        if row_index < 0:
+            return
+        column = index.column()
+        try:
+            text = self._display_row(row_index)[column]
+        except IndexError:
+            return
+        align = ALIGN_RIGHT if column in self._right_aligned_columns else ALIGN_LEFT
+        foreground = self._foreground(row_index, column)
+        for role_data in roleDataSpan:
+            role = role_data.role()
+            if role == DISPLAY_ROLE:
+                role_data.setData(text)
+            elif role == ALIGNMENT_ROLE:
+                role_data.setData(align)
+            elif role == FOREGROUND_ROLE and foreground is not None:
+                role_data.setData(foreground)
+            else:
+                role_data.clearData()
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.DisplayRole,
+    ) -> Any:  # type: ignore[override]
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        if 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def _display_row(self, row_index: int) -> tuple[Any, ...]:
+        raise NotImplementedError
+
+    def _foreground(self, row_index: int, column: int) -> QBrush | None:
+        return None
+
+    def _display_data(self, row_index: int, column: int) -> Any:
+        return self._display_row(row_index)[column]
+
+    def _alignment_data(self, row_index: int, column: int) -> int:
+        return ALIGN_RIGHT if column in self._right_aligned_columns else ALIGN_LEFT
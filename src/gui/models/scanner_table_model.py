@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable
 
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtCore import QModelIndex, QTimer
 from PySide6.QtGui import QBrush, QColor
 
+from .numeric_delegate import PERCENT_FORMAT, PRICE_FORMAT, NumericFormat
+from .row_ranges import contiguous_runs
+from .row_table_model import CHANGED_ROLES, RowTableModel
+_STATUS_BRUSHES = {
+    "LIVE": QBrush(QColor(27, 127, 42)),
+    "УГАСЛО": QBrush(QColor(122, 122, 122)),
+}
+_EMPTY = "—"
 
-@dataclass
+
+@dataclass(slots=True)
 class ScannerRow:
     """Container for a scanner row."""
 
@@ -26,7 +36,7 @@ class ScannerRow:
     status: str
 
 
-class ScannerTableModel(QAbstractTableModel):
+class ScannerTableModel(RowTableModel):
     """Qt table model for scanner results."""
 
     _headers = [
@@ -42,88 +52,107 @@ class ScannerTableModel(QAbstractTableModel):
         "Счёт",
         "Статус",
     ]
+    _right_aligned_columns = frozenset({2, 4, 5, 6, 7, 8, 9})
+
+    numeric_formats: dict[int, NumericFormat] = {
+        2: PRICE_FORMAT,
+        4: PRICE_FORMAT,
+        5: PRICE_FORMAT,
+        6: PERCENT_FORMAT,
+        7: NumericFormat(0, grouped=True),
+        9: NumericFormat(2),
+    }
 
     def __init__(self) -> None:
         super().__init__()
         self._rows: list[ScannerRow] = []
-
-    def rowCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
-        return len(self._rows)
-
-    def columnCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
-        return len(self._headers)
-
-    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
-        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
-            return None
-
-        row = self._rows[index.row()]
-        column = index.column()
-
-        if role == Qt.DisplayRole:
-            return self._format_display(row, column)
-
-        if role == Qt.TextAlignmentRole:
-            if column in {2, 4, 5, 6, 7, 8, 9}:
-                return int(Qt.AlignRight | Qt.AlignVCenter)
-            return int(Qt.AlignLeft | Qt.AlignVCenter)
-
-        if role == Qt.ForegroundRole and column == 10:
-            if row.status == "LIVE":
-                return QBrush(QColor(27, 127, 42))
-            if row.status == "УГАСЛО":
-                return QBrush(QColor(122, 122, 122))
-
-        return None
-
-    def headerData(
-        self,
-        section: int,
-        orientation: Qt.Orientation,
-        role: int = Qt.DisplayRole,
-    ) -> Any:  # type: ignore[override]
-        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
-            return None
-        if 0 <= section < len(self._headers):
-            return self._headers[section]
-        return None
+        # Display strings are formatted on first paint and dropped per row
+        # when that row changes, so off-screen rows cost nothing.
+        self._display_cache: dict[int, tuple[Any, ...]] = {}
+        self._dirty_rows: set[int] = set()
+        self._flush_scheduled = False
+        self._last_column = len(self._headers) - 1
 
     def set_rows(self, rows: list[ScannerRow]) -> None:
         """Replace the table rows with new items."""
         self.beginResetModel()
         self._rows = rows
+        self._dirty_rows.clear()
+        self._display_cache.clear()
         self.endResetModel()
 
+    def append_rows(self, rows: list[ScannerRow]) -> None:
+        """Append new rows to the end of the table."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def mark_row_dirty(self, row: int) -> None:
+        """Record an in-place row mutation; views are notified on the next tick."""
+        self._dirty_rows.add(row)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.notify_rows_updated)
+
     def notify_rows_updated(self) -> None:
-        """Notify views that existing rows were updated."""
-        if not self._rows:
+        """Drop cached text for dirty rows and emit one dataChanged per run."""
+        self._flush_scheduled = False
+        if not self._dirty_rows:
             return
-        top_left = self.index(0, 0)
-        bottom_right = self.index(len(self._rows) - 1, len(self._headers) - 1)
-        self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole])
-
-    @staticmethod
-    def _format_display(row: ScannerRow, column: int) -> str:
-        if column == 0:
-            return row.pair
-        if column == 1:
-            return row.best_buy_exchange or "—"
-        if column == 2:
-            return "—" if row.buy_ask is None else f"{row.buy_ask:.6f}"
-        if column == 3:
-            return row.best_sell_exchange or "—"
-        if column == 4:
-            return "—" if row.sell_bid is None else f"{row.sell_bid:.6f}"
-        if column == 5:
-            return "—" if row.spread_abs is None else f"{row.spread_abs:.6f}"
-        if column == 6:
-            return "—" if row.spread_pct is None else f"{row.spread_pct:.4f}%"
-        if column == 7:
-            return "—" if row.volume_24h is None else f"{row.volume_24h:,.0f}"
-        if column == 8:
-            return "—" if row.stable_hits is None else str(row.stable_hits)
-        if column == 9:
-            return "—" if row.score is None else f"{row.score:.2f}"
-        if column == 10:
-            return row.status
-        return ""
+        dirty = sorted(self._dirty_rows)
+        self._dirty_rows.clear()
+        cache = self._display_cache
+        for index in dirty:
+            cache.pop(index, None)
+        last_column = self._last_column
+        for first, last in contiguous_runs(dirty):
+            self.dataChanged.emit(
+                self.createIndex(first, 0),
+                self.createIndex(last, last_column),
+                CHANGED_ROLES,
+            )
+
+    def _display_row(self, row_index: int) -> tuple[Any, ...]:
+        cached = self._display_cache.get(row_index)
+        if cached is None:
+            cached = _format_row(self._rows[row_index])
+            self._display_cache[row_index] = cached
+        return cached
+
+    def _foreground(self, row_index: int, column: int) -> QBrush | None:
+        if column != 10:
+            return None
+        return _STATUS_BRUSHES.get(self._rows[row_index].status)
+
+
+# Numeric columns keep their float so NumericDelegate can format them at
+# paint time; only stable_hits is still rendered here.
+_COLUMN_SPECS: tuple[tuple[Callable[[ScannerRow], Any], str | None], ...] = (
+    (attrgetter("pair"), None),
+    (attrgetter("best_buy_exchange"), None),
+    (attrgetter("buy_ask"), None),
+    (attrgetter("best_sell_exchange"), None),
+    (attrgetter("sell_bid"), None),
+    (attrgetter("spread_abs"), None),
+    (attrgetter("spread_pct"), None),
+    (attrgetter("volume_24h"), None),
+    (attrgetter("stable_hits"), "%d"),
+    (attrgetter("score"), None),
+    (attrgetter("status"), None),
+)
+
+
+def _format_row(row: ScannerRow) -> tuple[Any, ...]:
+    return tuple([_format_value(getter(row), template) for getter, template in _COLUMN_SPECS])
+
+
+def _format_value(value: Any, template: str | None) -> Any:
+    """Map missing values to a dash and apply the column's %-template, if any."""
+    if value is None:
+        return _EMPTY
+    if template is None:
+        return value
+    return template % value
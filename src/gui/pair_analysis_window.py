@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
+import threading
 import time
+from typing import Callable
 
-from PySide6.QtCore import QObject, QTimer, Qt, Signal
-from PySide6.QtGui import QAction, QColor, QGuiApplication
+from PySide6.QtCore import QObject, QSignalBlocker, QTimer, Qt, Signal
+from PySide6.QtGui import QAction, QBrush, QColor, QGuiApplication
 from PySide6.QtWidgets import (
     QDoubleSpinBox,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
-    QListWidget,
+    QListView,
     QMainWindow,
     QMenu,
     QProgressBar,
@@ -25,11 +28,46 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .clock import now_text
+from .models.history_list_model import HistoryListModel
 from .services.ccxt_price_provider import CcxtPriceProvider
 from .services.ws_manager import WsManager
-from ..core.update_controller import get_update_controller
+from ..core.update_controller import get_update_controller, submit_coro
 from ..scanner.ticker_scan import PairExchangeTicker, TickerScanService
 
+# Shared placeholder for missing values; the formatters all return this
+# one object instead of each holding its own copy of the literal.
+_EMPTY = "—"
+_BACKGROUND_ROLE = Qt.BackgroundRole
+_UNSET = object()
+# Items start blank with no background, hence None for the brush slot.
+_UNSET_ROW = (_UNSET, _UNSET, _UNSET, _UNSET, _UNSET, None)
+_BEST_BUY_BRUSH = QBrush(QColor(220, 245, 224))
+_BEST_SELL_BRUSH = QBrush(QColor(227, 241, 255))
+
+# One provider for every pair window: its ccxt clients, HTTP session and
+# loaded markets carry over instead of being rebuilt per window. Workers
+# are created and closed on the GUI thread, so the count needs no lock.
+_price_provider: CcxtPriceProvider | None = None
+_price_provider_users = 0
+
+
+def _acquire_price_provider() -> CcxtPriceProvider:
+    global _price_provider, _price_provider_users  # noqa: PLW0603 - module-level singleton
+    if _price_provider is None:
+        _price_provider = CcxtPriceProvider()
+    _price_provider_users += 1
+    return _price_provider
+
+
+def _release_price_provider() -> None:
+    """Close the shared provider once the last pair window lets go of it."""
+    global _price_provider, _price_provider_users  # noqa: PLW0603 - module-level singleton
+    _price_provider_users -= 1
+    if _price_provider_users == 0 and _price_provider is not None:
+        _price_provider.close()
+        _price_provider = None
+
 
 @dataclass(frozen=True)
 class PairAnalysisSnapshot:
@@ -42,6 +80,8 @@ class PairAnalysisSnapshot:
     sell_bid: float | None
     spread_abs: float | None
     spread_pct: float | None
+    entry_spreads: list[float | None]
+    valid_entries: int
     errors: list[str]
 
 @dataclass(frozen=True)
@@ -59,16 +99,21 @@ class WsQuoteUpdate:
 class PairAnalysisWsWorker(QObject):
     """WebSocket worker that streams pair quotes via WsManager."""
 
-    quote_received = Signal(int, WsQuoteUpdate)
+    # Quotes are queued on the worker and only a bare wake-up crosses to
+    # the GUI thread; it is emitted once per batch, not once per quote.
+    quotes_ready = Signal()
     error = Signal(int, str)
 
-    def __init__(self, symbol: str, exchanges: list[str]) -> None:
+    def __init__(self, symbol: str, exchanges: tuple[str, ...]) -> None:
         super().__init__()
         self._symbol = symbol
-        self._exchanges = list(exchanges)
+        self._exchanges = exchanges
         self._run_id = 0
         self._last_quote_ts: float | None = None
-        self._price_provider = CcxtPriceProvider()
+        self._pending: deque[tuple[int, WsQuoteUpdate]] = deque()
+        self._pending_lock = threading.Lock()
+        self._wakeup_pending = False
+        self._price_provider = _acquire_price_provider()
         self._manager = WsManager(
             price_provider=self._price_provider,
             on_quote=self._on_quote,
@@ -83,8 +128,21 @@ class PairAnalysisWsWorker(QObject):
     def stop(self) -> None:
         self._manager.stop_all()
 
+    def close(self) -> None:
+        """Stop streaming and release the shared price provider."""
+        self.stop()
+        _release_price_provider()
+
+    def drain_quotes(self) -> list[tuple[int, WsQuoteUpdate]]:
+        """Return and clear the ``(run_id, update)`` pairs queued so far."""
+        with self._pending_lock:
+            batch = list(self._pending)
+            self._pending.clear()
+            self._wakeup_pending = False
+        return batch
+
     def _on_quote(self, quote: dict[str, object]) -> None:
-        timestamp = str(quote.get("timestamp") or datetime.now().strftime("%H:%M:%S"))
+        timestamp = str(quote.get("timestamp") or now_text())
         now = time.monotonic()
         latency_ms = None
         if self._last_quote_ts is not None:
@@ -98,7 +156,12 @@ class PairAnalysisWsWorker(QObject):
             status=str(quote.get("status") or "OK"),
             latency_ms=latency_ms,
         )
-        self.quote_received.emit(self._run_id, update)
+        with self._pending_lock:
+            self._pending.append((self._run_id, update))
+            notify = not self._wakeup_pending
+            self._wakeup_pending = True
+        if notify:
+            self.quotes_ready.emit()
 
     def _on_error(self, message: str) -> None:
         self.error.emit(self._run_id, message)
@@ -118,7 +181,9 @@ class PairAnalysisWindow(QMainWindow):
     ) -> None:
         super().__init__()
         self._symbol = symbol
-        self._exchanges = list(exchanges)
+        # Shared as-is with the WS worker and the HTTP fetch task.
+        self._exchanges = tuple(exchanges)
+        self._exchange_rows = {exchange: row for row, exchange in enumerate(self._exchanges)}
         self._opportunity_threshold = opportunity_threshold
         self._interval_ms = interval_ms
         self._bad_updates_streak = 0
@@ -127,7 +192,7 @@ class PairAnalysisWindow(QMainWindow):
         self._refresh_started_ts: float | None = None
         self._run_id = 0
         self._in_flight = False
-        self._http_job = None
+        self._http_job_key = f"pair-http-{symbol}"
         self._ws_worker: PairAnalysisWsWorker | None = None
         self._ws_last_update_ts: float | None = None
         self._ws_started_ts: float | None = None
@@ -136,11 +201,18 @@ class PairAnalysisWindow(QMainWindow):
         self._heartbeat_timer: QTimer | None = None
         self._http_timer: QTimer | None = None
         self._ws_stale_ms = 3000
+        self._ws_http_interval_ms = 10_000
         self._slow_threshold_ms = 5000
         self._fallback_active = False
         self._last_summary_key: tuple[float | None, float | None] | None = None
+        self._last_table_key: tuple[object, ...] | None = None
+        self._last_status_style: tuple[str, str] = ("", "")
+        self._last_net_profit_css = ""
         self._last_http_ts: float | None = None
+        self._ticker_service = TickerScanService()
         self._update_controller = get_update_controller()
+        self._update_controller.bus.succeeded.connect(self._on_job_succeeded)
+        self._update_controller.bus.failed.connect(self._on_job_failed)
 
         self.setWindowTitle(f"Анализ пары: {symbol}")
         self.resize(1100, 820)
@@ -173,7 +245,11 @@ class PairAnalysisWindow(QMainWindow):
         layout.addWidget(self._status_label)
         layout.addSpacing(16)
         self._refresh_progress = QProgressBar()
-        self._refresh_progress.setRange(0, 0)
+        # Determinate on purpose: a busy (0, 0) range animates continuously
+        # for the whole HTTP round trip.
+        self._refresh_progress.setRange(0, 100)
+        self._refresh_progress.setValue(0)
+        self._refresh_progress.setTextVisible(False)
         self._refresh_progress.setMaximumWidth(120)
         self._refresh_progress.setVisible(False)
         self._last_update_title = QLabel("Последнее обновление:")
@@ -239,8 +315,28 @@ class PairAnalysisWindow(QMainWindow):
         layout.addRow("Комиссия покупка %", self._buy_fee_spin)
         layout.addRow("Комиссия продажа %", self._sell_fee_spin)
         layout.addRow("Slippage %", self._slippage_spin)
+
+        for spin in (
+            self._budget_spin,
+            self._buy_fee_spin,
+            self._sell_fee_spin,
+            self._slippage_spin,
+        ):
+            spin.valueChanged.connect(self._on_parameters_changed)
+        self._on_parameters_changed()
         return group
 
+    def _on_parameters_changed(self) -> None:
+        # Cache the spin box values as plain floats so per-snapshot maths
+        # does not go through the widgets.
+        slippage = self._slippage_spin.value() / 100
+        self._budget = self._budget_spin.value()
+        self._buy_cost = self._budget * (1 + self._buy_fee_spin.value() / 100 + slippage)
+        self._sell_gain = self._budget * (1 - self._sell_fee_spin.value() / 100 - slippage)
+        # The net figures are only recomputed when the summary key changes,
+        # so force the next snapshot through once the inputs have moved.
+        self._last_summary_key = None
+
     def _build_summary_group(self) -> QGroupBox:
         group = QGroupBox("Итог")
         layout = QFormLayout(group)
@@ -273,15 +369,30 @@ class PairAnalysisWindow(QMainWindow):
         self._exchange_table.customContextMenuRequested.connect(
             self._show_exchange_context_menu
         )
+        # Items are created once per cell and only have their text and
+        # background updated on each tick. The exchange column never changes,
+        # so only the setText methods of the five value cells are kept.
+        self._row_items: list[list[QTableWidgetItem]] = []
+        self._row_setters: list[tuple[Callable[[str], None], ...]] = []
+        # Last values written per row; the sentinel forces the first write.
+        self._row_states: list[tuple[object, ...]] = [_UNSET_ROW] * len(self._exchanges)
         for row, exchange in enumerate(self._exchanges):
-            self._exchange_table.setItem(row, 0, QTableWidgetItem(exchange))
+            items = [QTableWidgetItem(exchange)]
+            items.extend(QTableWidgetItem() for _ in range(5))
+            for column, item in enumerate(items):
+                self._exchange_table.setItem(row, column, item)
+            self._row_items.append(items)
+            self._row_setters.append(tuple(item.setText for item in items[1:]))
         layout.addWidget(self._exchange_table)
         return group
 
     def _build_history_group(self) -> QGroupBox:
         group = QGroupBox("История (последние 20 строк)")
         layout = QVBoxLayout(group)
-        self._history_list = QListWidget()
+        self._history_model = HistoryListModel(self._history_limit)
+        self._history_list = QListView()
+        self._history_list.setModel(self._history_model)
+        self._history_list.setUniformItemSizes(True)
         layout.addWidget(self._history_list)
         return group
 
@@ -292,13 +403,14 @@ class PairAnalysisWindow(QMainWindow):
                 symbol=self._symbol,
                 exchanges=self._exchanges,
             )
-            self._ws_worker.quote_received.connect(self._on_ws_quote)
+            self._ws_worker.quotes_ready.connect(self._on_ws_quotes_ready)
             self._ws_worker.error.connect(self._on_ws_error)
         self._ws_entry_map = {}
         self._ws_last_update_ts = None
         self._ws_started_ts = time.monotonic()
         self._fallback_active = False
         self._last_summary_key = None
+        self._last_table_key = None
         self._ws_worker.start(self._run_id)
         self._start_fallback_timer()
         self._start_heartbeat_timer()
@@ -319,6 +431,7 @@ class PairAnalysisWindow(QMainWindow):
         self._latency_label.setText("—")
         self._slow_update = False
         self._last_summary_key = None
+        self._last_table_key = None
         self._start_button.setEnabled(True)
         self._stop_button.setEnabled(False)
         self._set_analysis_status("PAUSE")
@@ -334,6 +447,7 @@ class PairAnalysisWindow(QMainWindow):
         self._latency_label.setText("—")
         self._slow_update = False
         self._last_summary_key = None
+        self._last_table_key = None
         self._start_button.setEnabled(True)
         self._stop_button.setEnabled(False)
 
@@ -344,6 +458,14 @@ class PairAnalysisWindow(QMainWindow):
         self._start_worker()
         self._start_http_fallback(reason="manual")
 
+    def _on_job_succeeded(self, key: str, run_id: int, result: object) -> None:
+        if key == self._http_job_key:
+            self._on_http_snapshot(run_id, result)
+
+    def _on_job_failed(self, key: str, run_id: int, message: str) -> None:
+        if key == self._http_job_key:
+            self._on_http_failed(run_id, message)
+
     def _on_http_snapshot(self, run_id: int, snapshot: PairAnalysisSnapshot) -> None:
         if run_id != self._run_id:
             return
@@ -362,25 +484,36 @@ class PairAnalysisWindow(QMainWindow):
         self._finalize_refresh(source="HTTP")
         self._set_analysis_status("ERROR")
         self._add_history_line(
-            f"{datetime.now().strftime('%H:%M:%S')} | ERROR: {message}"
+            f"{now_text()} | ERROR: {message}"
         )
 
-    def _on_ws_quote(self, run_id: int, update: WsQuoteUpdate) -> None:
-        if run_id != self._run_id:
+    def _on_ws_quotes_ready(self) -> None:
+        if self._ws_worker is None:
             return
+        # The worker wakes us once per batch, so every quote queued since
+        # the last pass is folded into a single snapshot here.
+        last_update: WsQuoteUpdate | None = None
+        entry_map = self._ws_entry_map
+        for run_id, update in self._ws_worker.drain_quotes():
+            if run_id != self._run_id:
+                continue
+            entry_map[update.exchange] = PairExchangeTicker(
+                exchange=update.exchange,
+                bid=update.bid,
+                ask=update.ask,
+                volume_24h=None,
+                status=update.status,
+            )
+            last_update = update
+        if last_update is None:
+            return
+        # Labels only show the newest quote, so set them once per batch.
         self._ws_last_update_ts = time.monotonic()
         self._fallback_active = False
-        self._update_latency(update.latency_ms)
-        self._last_update_label.setText(update.timestamp)
+        self._update_latency(last_update.latency_ms)
+        self._last_update_label.setText(last_update.timestamp)
         self._delay_label.setText("0 ms")
-        self._ws_entry_map[update.exchange] = PairExchangeTicker(
-            exchange=update.exchange,
-            bid=update.bid,
-            ask=update.ask,
-            volume_24h=None,
-            status=update.status,
-        )
-        snapshot = _build_snapshot(list(self._ws_entry_map.values()), errors=[])
+        snapshot = _build_snapshot(list(entry_map.values()), errors=[])
         self._apply_snapshot(snapshot, source="WS")
 
     def _on_ws_error(self, run_id: int, message: str) -> None:
@@ -388,7 +521,7 @@ class PairAnalysisWindow(QMainWindow):
             return
         self._set_analysis_status("ERROR")
         self._add_history_line(
-            f"{datetime.now().strftime('%H:%M:%S')} | WS ERROR: {message}"
+            f"{now_text()} | WS ERROR: {message}"
         )
         if not self._fallback_active:
             self._start_http_fallback(reason="ws-error")
@@ -400,7 +533,7 @@ class PairAnalysisWindow(QMainWindow):
             latency_ms = (now - self._refresh_started_ts) * 1000
         self._refresh_progress.setVisible(False)
         if source == "HTTP":
-            self._last_update_label.setText(datetime.now().strftime("%H:%M:%S"))
+            self._last_update_label.setText(now_text())
             self._update_latency(latency_ms)
         self._refresh_started_ts = None
 
@@ -421,13 +554,29 @@ class PairAnalysisWindow(QMainWindow):
                 self._auto_pause_for_bad_data()
             return
         self._bad_updates_streak = 0
-        self._update_table(
-            snapshot.entries, snapshot.best_buy_exchange, snapshot.best_sell_exchange
+        # Slow pairs often repeat the previous quotes verbatim; comparing the
+        # raw values is far cheaper than reformatting and repainting 6N cells.
+        table_key = (
+            snapshot.best_buy_exchange,
+            snapshot.best_sell_exchange,
+            tuple(
+                (entry.exchange, entry.bid, entry.ask, entry.volume_24h, entry.status)
+                for entry in snapshot.entries
+            ),
         )
+        if table_key != self._last_table_key:
+            self._update_table(
+                snapshot.entries,
+                snapshot.entry_spreads,
+                snapshot.best_buy_exchange,
+                snapshot.best_sell_exchange,
+            )
+            self._last_table_key = table_key
         summary_key = (snapshot.buy_ask, snapshot.sell_bid)
         if summary_key != self._last_summary_key:
-            self._update_summary(snapshot)
-            self._append_history(snapshot)
+            net = self._calculate_net(snapshot)
+            self._update_summary(snapshot, net)
+            self._append_history(snapshot, net)
             self._last_summary_key = summary_key
         if snapshot.spread_pct is not None and snapshot.spread_pct >= self._opportunity_threshold:
             status = "LIVE"
@@ -438,59 +587,78 @@ class PairAnalysisWindow(QMainWindow):
     def _update_table(
         self,
         entries: list[PairExchangeTicker],
+        entry_spreads: list[float | None],
         best_buy_exchange: str | None,
         best_sell_exchange: str | None,
     ) -> None:
-        entry_map = {entry.exchange: entry for entry in entries}
-        for row, exchange in enumerate(self._exchanges):
-            background = None
-            if exchange == best_buy_exchange:
-                background = QColor(220, 245, 224)
-            elif exchange == best_sell_exchange:
-                background = QColor(227, 241, 255)
-            entry = entry_map.get(exchange)
-            if entry is None:
-                self._set_table_row(row, exchange, None, None, None, None, "—", background)
-                continue
-            spread_pct = None
-            if entry.bid and entry.ask and entry.bid > 0 and entry.ask > 0:
-                mid = (entry.bid + entry.ask) / 2
-                if mid > 0:
-                    spread_pct = (entry.ask - entry.bid) / mid * 100
-            self._set_table_row(
-                row,
-                exchange,
-                entry.bid,
-                entry.ask,
-                spread_pct,
-                entry.volume_24h,
-                entry.status,
-                background,
-            )
+        # Nothing listens to itemChanged here; blocking it spares one signal
+        # per cell write while the view still repaints from the model.
+        with QSignalBlocker(self._exchange_table):
+            # Entries carry one quote per exchange, so a plain count tells
+            # whether every row was written; the set of written exchanges is
+            # only built on the rarer partial update.
+            filled = 0
+            for entry, spread_pct in zip(entries, entry_spreads):
+                row = self._exchange_rows.get(entry.exchange)
+                if row is None:
+                    continue
+                filled += 1
+                self._set_table_row(
+                    row,
+                    entry.bid,
+                    entry.ask,
+                    spread_pct,
+                    entry.volume_24h,
+                    entry.status,
+                    _row_background(entry.exchange, best_buy_exchange, best_sell_exchange),
+                )
+            if filled == len(self._exchanges):
+                return
+            written = {entry.exchange for entry in entries}
+            for row, exchange in enumerate(self._exchanges):
+                if exchange not in written:
+                    background = _row_background(exchange, best_buy_exchange, best_sell_exchange)
+                    self._set_table_row(row, None, None, None, None, _EMPTY, background)
 
     def _set_table_row(
         self,
         row: int,
-        exchange: str,
         bid: float | None,
         ask: float | None,
         spread_pct: float | None,
         volume_24h: float | None,
         status: str,
-        background: QColor | None,
+        background: QBrush | None,
     ) -> None:
-        items = [
-            QTableWidgetItem(exchange),
-            QTableWidgetItem(_fmt_value(bid)),
-            QTableWidgetItem(_fmt_value(ask)),
-            QTableWidgetItem(_fmt_pct(spread_pct)),
-            QTableWidgetItem(_fmt_value(volume_24h)),
-            QTableWidgetItem(status),
-        ]
-        for column, item in enumerate(items):
-            if background is not None:
+        state = (bid, ask, spread_pct, volume_24h, status, background)
+        previous = self._row_states[row]
+        if state == previous:
+            return
+        self._row_states[row] = state
+        old_bid, old_ask, old_spread, old_volume, old_status, old_background = previous
+        set_bid, set_ask, set_spread, set_volume, set_status = self._row_setters[row]
+        # Only cells whose raw value moved are reformatted and rewritten;
+        # on a quiet market most ticks change one or two cells per row.
+        if bid != old_bid:
+            set_bid(_fmt_value(bid))
+        if ask != old_ask:
+            set_ask(_fmt_value(ask))
+        if spread_pct != old_spread:
+            set_spread(_fmt_pct(spread_pct))
+        if volume_24h != old_volume:
+            set_volume(_fmt_value(volume_24h))
+        if status != old_status:
+            set_status(status)
+        # The highlight brushes are shared constants, so an identity check
+        # tells whether the row colour actually moved since the last tick.
+        if background is old_background:
+            return
+        if background is None:
+            for item in self._row_items[row]:
+                item.setData(_BACKGROUND_ROLE, None)
+        else:
+            for item in self._row_items[row]:
                 item.setBackground(background)
-            self._exchange_table.setItem(row, column, item)
 
     def _start_fallback_timer(self) -> None:
         if self._fallback_timer is None:
@@ -520,22 +688,19 @@ class PairAnalysisWindow(QMainWindow):
         self._in_flight = True
         self._fallback_active = True
         self._refresh_started_ts = time.monotonic()
+        self._refresh_progress.setValue(50)
         self._refresh_progress.setVisible(True)
-        self._http_job = self._update_controller.submit(
-            key=f"pair-http-{self._symbol}",
+        submitted = self._update_controller.submit_async(
+            key=self._http_job_key,
             run_id=self._run_id,
-            task=lambda: _build_snapshot(
-                *TickerScanService().fetch_pair_tickers(self._symbol, self._exchanges)
-            ),
+            task=lambda: _fetch_snapshot(self._ticker_service, self._symbol, self._exchanges),
         )
-        if not self._http_job:
+        if not submitted:
             self._in_flight = False
             self._refresh_progress.setVisible(False)
             return
-        self._http_job.succeeded.connect(self._on_http_snapshot)
-        self._http_job.failed.connect(self._on_http_failed)
         self._add_history_line(
-            f"{datetime.now().strftime('%H:%M:%S')} | HTTP fallback ({reason})"
+            f"{now_text()} | HTTP fallback ({reason})"
         )
 
     def _check_ws_staleness(self) -> None:
@@ -580,8 +745,19 @@ class PairAnalysisWindow(QMainWindow):
     def _on_http_timer(self) -> None:
         if self._start_button.isEnabled():
             return
+        if self._ws_is_fresh() and self._last_http_ts is not None:
+            # Quotes are already pushed over WS; only poll REST occasionally
+            # to pick up the fields the stream does not carry (24h volume).
+            elapsed_ms = (time.monotonic() - self._last_http_ts) * 1000
+            if elapsed_ms < self._ws_http_interval_ms:
+                return
         self._request_http_snapshot(reason="interval", force=True)
 
+    def _ws_is_fresh(self) -> bool:
+        if self._ws_last_update_ts is None:
+            return False
+        return (time.monotonic() - self._ws_last_update_ts) * 1000 < self._ws_stale_ms
+
     def _update_heartbeat(self) -> None:
         if self._ws_last_update_ts is None:
             self._heartbeat_label.setText("—")
@@ -589,7 +765,9 @@ class PairAnalysisWindow(QMainWindow):
         phase = int(time.monotonic() * 2) % 3 + 1
         self._heartbeat_label.setText("●" * phase)
 
-    def _update_summary(self, snapshot: PairAnalysisSnapshot) -> None:
+    def _update_summary(
+        self, snapshot: PairAnalysisSnapshot, net: tuple[float | None, float | None]
+    ) -> None:
         self._best_buy_label.setText(_fmt_best(snapshot.best_buy_exchange, snapshot.buy_ask))
         self._best_sell_label.setText(
             _fmt_best(snapshot.best_sell_exchange, snapshot.sell_bid)
@@ -597,9 +775,9 @@ class PairAnalysisWindow(QMainWindow):
         gross_pct = snapshot.spread_pct
         gross_abs = None
         if snapshot.buy_ask and snapshot.sell_bid:
-            gross_abs = (snapshot.sell_bid / snapshot.buy_ask - 1) * self._budget_spin.value()
+            gross_abs = (snapshot.sell_bid / snapshot.buy_ask - 1) * self._budget
         self._gross_spread_label.setText(_fmt_pct_value(gross_pct, gross_abs))
-        net_profit, net_spread_pct = self._calculate_net(snapshot)
+        net_profit, net_spread_pct = net
         self._net_spread_label.setText(_fmt_pct_value(net_spread_pct, net_profit))
         self._net_profit_label.setText(_fmt_value(net_profit))
         self._style_net_profit_label(net_profit)
@@ -609,21 +787,18 @@ class PairAnalysisWindow(QMainWindow):
     ) -> tuple[float | None, float | None]:
         if snapshot.buy_ask is None or snapshot.sell_bid is None:
             return None, None
-        budget = self._budget_spin.value()
-        buy_fee = self._buy_fee_spin.value() / 100
-        sell_fee = self._sell_fee_spin.value() / 100
-        slippage = self._slippage_spin.value() / 100
-        buy_cost = budget * (1 + buy_fee + slippage)
-        sell_gain = budget * (1 - sell_fee - slippage)
-        if buy_cost <= 0:
-            return None, None
-        net_profit = (snapshot.sell_bid / snapshot.buy_ask) * sell_gain - buy_cost
-        net_spread_pct = net_profit / buy_cost * 100
-        return net_profit, net_spread_pct
+        return _net_result(
+            snapshot.buy_ask,
+            snapshot.sell_bid,
+            self._buy_cost,
+            self._sell_gain,
+        )
 
-    def _append_history(self, snapshot: PairAnalysisSnapshot) -> None:
-        net_profit, net_spread_pct = self._calculate_net(snapshot)
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    def _append_history(
+        self, snapshot: PairAnalysisSnapshot, net: tuple[float | None, float | None]
+    ) -> None:
+        net_profit, net_spread_pct = net
+        timestamp = now_text()
         buy_text = _fmt_exchange_price(snapshot.best_buy_exchange, snapshot.buy_ask)
         sell_text = _fmt_exchange_price(snapshot.best_sell_exchange, snapshot.sell_bid)
         gross_text = _fmt_pct(snapshot.spread_pct)
@@ -636,9 +811,7 @@ class PairAnalysisWindow(QMainWindow):
         self._add_history_line(line)
 
     def _add_history_line(self, line: str) -> None:
-        self._history_list.insertItem(0, line)
-        while self._history_list.count() > self._history_limit:
-            self._history_list.takeItem(self._history_list.count() - 1)
+        self._history_model.add_line(line)
 
     def _bump_run_id(self) -> None:
         self._run_id += 1
@@ -647,6 +820,10 @@ class PairAnalysisWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         self._stop_worker()
+        if self._ws_worker is not None:
+            self._ws_worker.close()
+            self._ws_worker = None
+        submit_coro(self._ticker_service.aclose())
         super().closeEvent(event)
 
     def _set_analysis_status(self, status: str) -> None:
@@ -663,45 +840,48 @@ class PairAnalysisWindow(QMainWindow):
         status_text = status
         if self._slow_update:
             status_text = f"{status} · Долго… (возможен rate-limit)"
+        key = (color, status_text)
+        if key == self._last_status_style:
+            return
+        self._last_status_style = key
         self._status_label.setText(status_text)
         self._status_label.setStyleSheet(f"font-weight: 600; color: {color};")
 
     def _has_valid_data(self, snapshot: PairAnalysisSnapshot) -> bool:
-        valid_exchanges = sum(
-            1
-            for entry in snapshot.entries
-            if entry.bid is not None
-            and entry.ask is not None
-            and entry.bid > 0
-            and entry.ask > 0
+        # Both checks read fields filled in by _build_snapshot's single pass,
+        # so no entry is revisited here.
+        return (
+            snapshot.buy_ask is not None
+            and snapshot.sell_bid is not None
+            and snapshot.valid_entries >= 2
         )
-        if valid_exchanges < 2:
-            return False
-        if snapshot.buy_ask is None or snapshot.sell_bid is None:
-            return False
-        return True
 
     def _append_error_history(self) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = now_text()
         self._add_history_line(f"{timestamp} | ERROR: недостаточно данных")
 
     def _auto_pause_for_bad_data(self) -> None:
         self._pause_worker()
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = now_text()
         self._add_history_line(
             f"{timestamp} | Авто-пауза: нет валидных данных 5 обновлений"
         )
 
     def _style_net_profit_label(self, net_profit: float | None) -> None:
         if net_profit is None:
-            self._net_profit_label.setStyleSheet("color: #666666;")
-            return
-        if net_profit > 0:
-            self._net_profit_label.setStyleSheet("font-weight: 600; color: #1b7f2a;")
+            css = "color: #666666;"
+        elif net_profit > 0:
+            css = "font-weight: 600; color: #1b7f2a;"
         elif net_profit < 0:
-            self._net_profit_label.setStyleSheet("color: #b00020;")
+            css = "color: #b00020;"
         else:
-            self._net_profit_label.setStyleSheet("color: #666666;")
+            css = "color: #666666;"
+        # setStyleSheet re-parses the CSS and restyles the label even when
+        # the string is identical, so only apply actual changes.
+        if css == self._last_net_profit_css:
+            return
+        self._last_net_profit_css = css
+        self._net_profit_label.setStyleSheet(css)
 
     def _show_exchange_context_menu(self, position) -> None:
         index = self._exchange_table.indexAt(position)
@@ -725,6 +905,13 @@ class PairAnalysisWindow(QMainWindow):
         QGuiApplication.clipboard().setText(text)
 
 
+async def _fetch_snapshot(
+    service: TickerScanService, symbol: str, exchanges: tuple[str, ...]
+) -> PairAnalysisSnapshot:
+    entries, errors = await service.fetch_pair_tickers_async(symbol, exchanges)
+    return _build_snapshot(entries, errors)
+
+
 def _build_snapshot(
     entries: list[PairExchangeTicker],
     errors: list[str],
@@ -735,17 +922,26 @@ def _build_snapshot(
     sell_bid = None
     spread_abs = None
     spread_pct = None
-    bids: list[tuple[float, str]] = []
-    asks: list[tuple[float, str]] = []
+    entry_spreads: list[float | None] = []
+    valid_entries = 0
+    # One pass picks the lowest ask and highest bid; ties keep the first
+    # exchange, matching min()/max() over the entries. The per-exchange
+    # spread rides along so the table does not walk the entries again.
     for entry in entries:
-        if entry.bid is not None and entry.bid > 0:
-            bids.append((entry.bid, entry.exchange))
-        if entry.ask is not None and entry.ask > 0:
-            asks.append((entry.ask, entry.exchange))
-    if asks:
-        buy_ask, best_buy_exchange = min(asks, key=lambda item: item[0])
-    if bids:
-        sell_bid, best_sell_exchange = max(bids, key=lambda item: item[0])
+        bid = entry.bid
+        ask = entry.ask
+        if bid is not None and ask is not None and bid > 0 and ask > 0:
+            # (ask - bid) / mid * 100 with mid = (ask + bid) / 2.
+            entry_spreads.append((ask - bid) / (ask + bid) * 200)
+            valid_entries += 1
+        else:
+            entry_spreads.append(None)
+        if bid is not None and bid > 0 and (sell_bid is None or bid > sell_bid):
+            sell_bid = bid
+            best_sell_exchange = entry.exchange
+        if ask is not None and ask > 0 and (buy_ask is None or ask < buy_ask):
+            buy_ask = ask
+            best_buy_exchange = entry.exchange
     if buy_ask is not None and sell_bid is not None:
         spread_abs = sell_bid - buy_ask
         mid = (sell_bid + buy_ask) / 2
@@ -759,10 +955,34 @@ def _build_snapshot(
         sell_bid=sell_bid,
         spread_abs=spread_abs,
         spread_pct=spread_pct,
+        entry_spreads=entry_spreads,
+        valid_entries=valid_entries,
         errors=errors,
     )
 
 
+def _net_result(
+    buy_ask: float,
+    sell_bid: float,
+    buy_cost: float,
+    sell_gain: float,
+) -> tuple[float | None, float | None]:
+    if buy_cost <= 0:
+        return None, None
+    net_profit = sell_bid / buy_ask * sell_gain - buy_cost
+    return net_profit, net_profit / buy_cost * 100
+
+
+def _row_background(
+    exchange: str, best_buy_exchange: str | None, best_sell_exchange: str | None
+) -> QBrush | None:
+    if exchange == best_buy_exchange:
+        return _BEST_BUY_BRUSH
+    if exchange == best_sell_exchange:
+        return _BEST_SELL_BRUSH
+    return None
+
+
 def _as_float(value: object) -> float | None:
     if value is None:
         return None
@@ -772,21 +992,39 @@ def _as_float(value: object) -> float | None:
         return None
 
 
+# Quotes move on a fixed tick grid and spreads hover around a few values,
+# so the same floats come back tick after tick; keying on the exact float
+# keeps the output identical to formatting it afresh. 0.0 and -0.0 compare
+# and hash equal, so zero is normalised before the lookup; otherwise
+# whichever sign is formatted first would be served for both.
 def _fmt_value(value: float | None) -> str:
     if value is None:
-        return "—"
-    return f"{value:,.6f}".rstrip("0").rstrip(".")
+        return _EMPTY
+    return _fmt_value_cached(value + 0.0)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_value_cached(value: float) -> str:
+    # One rstrip pass plus a slice: cheaper than chaining a second rstrip,
+    # and a hand-rolled character loop in Python is slower than either.
+    text = f"{value:,.6f}".rstrip("0")
+    return text[:-1] if text[-1] == "." else text
 
 
 def _fmt_pct(value: float | None) -> str:
     if value is None:
-        return "—"
+        return _EMPTY
+    return _fmt_pct_cached(value + 0.0)
+
+
+@lru_cache(maxsize=1024)
+def _fmt_pct_cached(value: float) -> str:
     return f"{value:.2f}%"
 
 
 def _fmt_pct_value(pct: float | None, value: float | None) -> str:
     if pct is None and value is None:
-        return "—"
+        return _EMPTY
     pct_text = _fmt_pct(pct)
     value_text = _fmt_value(value)
     return f"{pct_text} / {value_text}"
@@ -794,12 +1032,11 @@ def _fmt_pct_value(pct: float | None, value: float | None) -> str:
 
 def _fmt_best(exchange: str | None, price: float | None) -> str:
     if exchange is None or price is None:
-        return "—"
-    return f"{exchange} @ {price:,.6f}".rstrip("0").rstrip(".")
+        return _EMPTY
+    return f"{exchange} @ {_fmt_value(price)}"
 
 
 def _fmt_exchange_price(exchange: str | None, price: float | None) -> str:
     if exchange is None or price is None:
-        return "—"
-    price_text = f"{price:,.6f}".rstrip("0").rstrip(".")
-    return f"{exchange}@{price_text}"
+        return _EMPTY
+    return f"{exchange}@{_fmt_value(price)}"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+import sys
 import time
 
 from PySide6.QtCore import QTimer, Qt
@@ -26,11 +27,15 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .models.numeric_delegate import install_numeric_delegates
 from .models.scanner_table_model import ScannerRow, ScannerTableModel
 from .pair_analysis_window import PairAnalysisWindow
 from ..core.update_controller import get_update_controller
 from ..scanner.market_discovery import MarketDiscoveryResult, MarketDiscoveryService
-from ..scanner.ticker_scan import TickerScanResult, TickerScanService
+from ..scanner.ticker_scan import TickerScanResult, TickerScanService, TickerScanUpdate
+
+_DISCOVERY_JOB_KEY = "scanner-discovery"
+_SCAN_JOB_KEY = "scanner-scan"
 
 
 class ScannerWindow(QMainWindow):
@@ -59,9 +64,9 @@ class ScannerWindow(QMainWindow):
         self._profit_rows: list[ScannerRow] = []
         self._scanning = False
         self._last_updated = "—"
-        self._discovery_job = None
+        self._discovery_in_flight = False
         self._discovery_request_id = 0
-        self._scan_job = None
+        self._scan_started: float | None = None
         self._pair_exchanges: dict[str, list[str]] = {}
         self._selected_exchanges_count = 0
         self._analysis_windows: dict[str, PairAnalysisWindow] = {}
@@ -78,7 +83,10 @@ class ScannerWindow(QMainWindow):
         self._last_scan_ok = 0
         self._last_scan_fail = 0
         self._next_scan_eta_s: float | None = None
+        self._ticker_service = TickerScanService()
         self._update_controller = get_update_controller()
+        self._update_controller.bus.succeeded.connect(self._on_job_succeeded)
+        self._update_controller.bus.failed.connect(self._on_job_failed)
 
         self._build_ui()
         self._start_heartbeat_timer()
@@ -202,9 +210,11 @@ class ScannerWindow(QMainWindow):
         group = QGroupBox("Профитные")
         layout = QVBoxLayout(group)
         self._profit_table_model = ScannerTableModel()
+        self._profit_table_model.set_rows(self._profit_rows)
         self._profit_table_view = QTableView()
         self._profit_proxy_model = self._create_proxy_model(self._profit_table_model)
         self._profit_table_view.setModel(self._profit_proxy_model)
+        install_numeric_delegates(self._profit_table_view, ScannerTableModel.numeric_formats)
         self._profit_table_view.setSortingEnabled(True)
         self._profit_table_view.setAlternatingRowColors(True)
         self._profit_table_view.horizontalHeader().setStretchLastSection(True)
@@ -303,7 +313,7 @@ class ScannerWindow(QMainWindow):
         self._eligible_pairs = []
         self._pair_exchanges = {}
         self._profit_rows = []
-        self._profit_table_model.set_rows([])
+        self._profit_table_model.set_rows(self._profit_rows)
         self._scanning = True
         self._last_scan_ts = None
         self._start_button.setEnabled(False)
@@ -341,7 +351,7 @@ class ScannerWindow(QMainWindow):
         self._eligible_pairs = []
         self._pair_exchanges = {}
         self._profit_rows = []
-        self._profit_table_model.set_rows([])
+        self._profit_table_model.set_rows(self._profit_rows)
         self._scanning = False
         self._last_scan_ts = None
         self._start_button.setEnabled(True)
@@ -352,7 +362,7 @@ class ScannerWindow(QMainWindow):
         self._update_status()
 
     def _refresh_markets(self) -> None:
-        if self._discovery_job is not None:
+        if self._discovery_in_flight:
             self._log("Обновление рынков уже выполняется")
             return
         selected_exchanges = self._selected_exchanges()
@@ -410,8 +420,8 @@ class ScannerWindow(QMainWindow):
     ) -> None:
         self._discovery_request_id += 1
         request_id = self._discovery_request_id
-        self._discovery_job = self._update_controller.submit(
-            key="scanner-discovery",
+        self._discovery_in_flight = self._update_controller.submit(
+            key=_DISCOVERY_JOB_KEY,
             run_id=request_id,
             task=lambda: MarketDiscoveryService().discover(
                 exchanges,
@@ -421,21 +431,30 @@ class ScannerWindow(QMainWindow):
                 refresh_cache=refresh_cache,
             ),
         )
-        if not self._discovery_job:
+        if not self._discovery_in_flight:
             self._log("Market discovery already in progress")
-            return
-        self._discovery_job.succeeded.connect(self._on_discovery_finished)
-        self._discovery_job.failed.connect(self._on_discovery_failed)
 
     def _cancel_market_discovery(self) -> None:
         self._discovery_request_id += 1
-        self._update_controller.clear_key("scanner-discovery")
-        self._discovery_job = None
+        self._update_controller.clear_key(_DISCOVERY_JOB_KEY)
+        self._discovery_in_flight = False
+
+    def _on_job_succeeded(self, key: str, run_id: int, result: object) -> None:
+        if key == _DISCOVERY_JOB_KEY:
+            self._on_discovery_finished(run_id, result)
+        elif key == _SCAN_JOB_KEY:
+            self._on_ticker_updated(run_id, result)
+
+    def _on_job_failed(self, key: str, run_id: int, message: str) -> None:
+        if key == _DISCOVERY_JOB_KEY:
+            self._on_discovery_failed(run_id, message)
+        elif key == _SCAN_JOB_KEY:
+            self._on_ticker_failed(run_id, message)
 
     def _on_discovery_finished(self, request_id: int, result: MarketDiscoveryResult) -> None:
         if request_id != self._discovery_request_id:
             return
-        self._discovery_job = None
+        self._discovery_in_flight = False
         for exchange, count in result.exchange_counts.items():
             self._log(f"Рынки загружены: {exchange}={count}")
         min_exchanges = self._min_exchanges_spin.value()
@@ -445,7 +464,7 @@ class ScannerWindow(QMainWindow):
         self._pair_exchanges = result.pair_exchanges
         self._eligible_pairs = list(result.eligible_pairs)
         self._profit_rows = []
-        self._profit_table_model.set_rows([])
+        self._profit_table_model.set_rows(self._profit_rows)
         if self._scanning:
             min_exchanges = self._min_exchanges_spin.value()
             if not self._eligible_pairs:
@@ -468,7 +487,7 @@ class ScannerWindow(QMainWindow):
     def _on_discovery_failed(self, request_id: int, message: str) -> None:
         if request_id != self._discovery_request_id:
             return
-        self._discovery_job = None
+        self._discovery_in_flight = False
         self._log(f"Ошибка поиска рынков: {message}")
         self._stop_ticker_scan()
         self._scanning = False
@@ -496,7 +515,6 @@ class ScannerWindow(QMainWindow):
         )
 
     def _stop_ticker_scan(self) -> None:
-        self._scan_job = None
         self._scan_in_flight = False
         self._scan_backoff_s = 0.0
         if self._scan_timer:
@@ -506,81 +524,61 @@ class ScannerWindow(QMainWindow):
         if not self._scanning or self._scan_in_flight:
             return
         self._scan_in_flight = True
-        scan_started = time.monotonic()
-        self._scan_job = self._update_controller.submit(
-            key="scanner-scan",
+        self._scan_started = time.monotonic()
+        submitted = self._update_controller.submit(
+            key=_SCAN_JOB_KEY,
             run_id=self._scan_run_id,
-            task=lambda: TickerScanService().scan(
+            task=lambda: self._ticker_service.scan(
                 self._pair_exchanges,
                 self._max_pairs_spin.value(),
                 pairs=self._eligible_pairs,
                 max_intrabook_spread_pct=self._max_spread_spin.value(),
             ),
         )
-        if not self._scan_job:
+        if not submitted:
             self._scan_in_flight = False
-            return
-        self._scan_job.succeeded.connect(
-            lambda run_id, result: self._on_ticker_updated(run_id, result, scan_started)
-        )
-        self._scan_job.failed.connect(
-            lambda run_id, message: self._on_ticker_failed(run_id, message, scan_started)
-        )
 
-    def _on_ticker_updated(
-        self, run_id: int, result: TickerScanResult, scan_started: float
-    ) -> None:
+    def _on_ticker_updated(self, run_id: int, result: TickerScanResult) -> None:
         self._scan_in_flight = False
         if not self._scanning or run_id != self._scan_run_id:
             return
-        scan_latency_ms = (time.monotonic() - scan_started) * 1000
+        scan_latency_ms = self._scan_latency_ms()
         self._last_scan_duration_ms = scan_latency_ms
         self._last_scan_ok = result.ok_count
         self._last_scan_fail = result.fail_count
         self._adjust_scan_backoff(result.fail_count)
         threshold = self._opportunity_threshold_spin.value()
-        row_map = {row.pair: row for row in self._profit_rows}
+        # The model shares the _profit_rows list: rows are mutated in place and
+        # the touched indices are re-emitted together on the next event-loop
+        # tick; new pairs are appended.
+        model = self._profit_table_model
+        rows = self._profit_rows
+        positions = {row.pair: index for index, row in enumerate(rows)}
+        new_rows: dict[str, ScannerRow] = {}
         for update in result.updates:
             spread_pct = update.spread_pct
-            if spread_pct is not None and spread_pct >= threshold:
-                row = row_map.get(update.pair)
-                if row is None:
-                    row = ScannerRow(
-                        pair=update.pair,
-                        best_buy_exchange=update.best_buy_exchange,
-                        buy_ask=update.buy_ask,
-                        best_sell_exchange=update.best_sell_exchange,
-                        sell_bid=update.sell_bid,
-                        spread_abs=update.spread_abs,
-                        spread_pct=update.spread_pct,
-                        volume_24h=update.volume_24h,
-                        stable_hits=None,
-                        score=None,
-                        status="LIVE",
-                    )
-                    self._profit_rows.append(row)
-                    row_map[update.pair] = row
-                else:
-                    row.best_buy_exchange = update.best_buy_exchange
-                    row.buy_ask = update.buy_ask
-                    row.best_sell_exchange = update.best_sell_exchange
-                    row.sell_bid = update.sell_bid
-                    row.spread_abs = update.spread_abs
-                    row.spread_pct = update.spread_pct
-                    row.volume_24h = update.volume_24h
-                    row.status = "LIVE"
-            else:
-                row = row_map.get(update.pair)
-                if row:
-                    row.best_buy_exchange = update.best_buy_exchange
-                    row.buy_ask = update.buy_ask
-                    row.best_sell_exchange = update.best_sell_exchange
-                    row.sell_bid = update.sell_bid
-                    row.spread_abs = update.spread_abs
-                    row.spread_pct = update.spread_pct
-                    row.volume_24h = update.volume_24h
-                    row.status = "УГАСЛО"
-        self._profit_table_model.set_rows(self._profit_rows)
+            status = "LIVE" if spread_pct is not None and spread_pct >= threshold else "УГАСЛО"
+            index = positions.get(update.pair)
+            if index is not None:
+                self._apply_ticker_update(rows[index], update, status)
+                model.mark_row_dirty(index)
+            elif update.pair in new_rows:
+                self._apply_ticker_update(new_rows[update.pair], update, status)
+            elif status == "LIVE":
+                new_rows[update.pair] = ScannerRow(
+                    pair=update.pair,
+                    best_buy_exchange=_intern_name(update.best_buy_exchange),
+                    buy_ask=update.buy_ask,
+                    best_sell_exchange=_intern_name(update.best_sell_exchange),
+                    sell_bid=update.sell_bid,
+                    spread_abs=update.spread_abs,
+                    spread_pct=update.spread_pct,
+                    volume_24h=update.volume_24h,
+                    stable_hits=None,
+                    score=None,
+                    status=status,
+                )
+        model.append_rows(list(new_rows.values()))
         self._last_scan_ts = time.monotonic()
         self._last_updated = datetime.now().strftime("%H:%M:%S")
         self._update_status()
@@ -592,19 +590,33 @@ class ScannerWindow(QMainWindow):
             f"skipped={result.skipped_count} fail={result.fail_count}"
         )
 
-    def _on_ticker_failed(
-        self, run_id: int, message: str, scan_started: float
-    ) -> None:
+    @staticmethod
+    def _apply_ticker_update(row: ScannerRow, update: TickerScanUpdate, status: str) -> None:
+        row.best_buy_exchange = _intern_name(update.best_buy_exchange)
+        row.buy_ask = update.buy_ask
+        row.best_sell_exchange = _intern_name(update.best_sell_exchange)
+        row.sell_bid = update.sell_bid
+        row.spread_abs = update.spread_abs
+        row.spread_pct = update.spread_pct
+        row.volume_24h = update.volume_24h
+        row.status = status
+
+    def _on_ticker_failed(self, run_id: int, message: str) -> None:
         self._scan_in_flight = False
         if run_id != self._scan_run_id:
             return
-        scan_latency_ms = (time.monotonic() - scan_started) * 1000
+        scan_latency_ms = self._scan_latency_ms()
         self._last_scan_duration_ms = scan_latency_ms
         self._last_scan_ok = 0
         self._last_scan_fail += 1
         self._adjust_scan_backoff(1)
         self._log(f"Ошибка сканирования тикеров: {message}")
 
+    def _scan_latency_ms(self) -> float | None:
+        if self._scan_started is None:
+            return None
+        return (time.monotonic() - self._scan_started) * 1000
+
     def _log(self, message: str) -> None:
         timestamp = datetime.now().strftime("%H:%M:%S")
         self._log_view.appendPlainText(f"[{timestamp}] {message}")
@@ -701,3 +713,8 @@ class ScannerWindow(QMainWindow):
                     f"Backoff активирован: {self._scan_backoff_s:.0f}s "
                     f"(interval={next_ms} ms)"
                 )
+
+
+def _intern_name(name: str | None) -> str | None:
+    """Intern exchange labels so the many rows naming them share one string."""
+    return None if name is None else sys.intern(name)
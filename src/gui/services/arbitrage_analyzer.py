@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import heapq
+from operator import itemgetter
 from typing import Iterable
 
 
@@ -42,6 +44,29 @@ class ArbitrageResult:
     opportunities: list[Opportunity]
 
 
+@dataclass(frozen=True)
+class QuoteColumns:
+    """Valid quotes stored as parallel columns, one list per field."""
+
+    exchanges: list[str]
+    bids: list[float]
+    asks: list[float]
+    lasts: list[float]
+    timestamps: list[str]
+    sources: list[str]
+
+    def snapshot(self, index: int) -> QuoteSnapshot:
+        return QuoteSnapshot(
+            exchange=self.exchanges[index],
+            bid=self.bids[index],
+            ask=self.asks[index],
+            last=self.lasts[index],
+            status="OK",
+            timestamp=self.timestamps[index],
+            source=self.sources[index],
+        )
+
+
 def analyze(
     quotes: Iterable[dict[str, object]],
     min_spread_pct: float = 0.0,
@@ -49,20 +74,21 @@ def analyze(
     top_n: int = 10,
 ) -> ArbitrageResult:
     """Analyze quotes and compute arbitrage opportunities."""
-    valid_quotes = _filter_valid(quotes, only_ws=only_ws)
-    if not valid_quotes:
+    columns = _filter_valid(quotes, only_ws=only_ws)
+    if not columns.exchanges:
         return ArbitrageResult(None, None, 0.0, 0.0, [])
 
-    best_buy = min(valid_quotes, key=lambda quote: quote.ask)
-    best_sell = max(valid_quotes, key=lambda quote: quote.bid)
+    positions = range(len(columns.exchanges))
+    best_buy = columns.snapshot(min(positions, key=columns.asks.__getitem__))
+    best_sell = columns.snapshot(max(positions, key=columns.bids.__getitem__))
     spread_abs = best_sell.bid - best_buy.ask
     spread_pct = (spread_abs / best_buy.ask * 100.0) if best_buy.ask else 0.0
-    opportunities = _build_opportunities(valid_quotes, min_spread_pct=min_spread_pct, top_n=top_n)
+    opportunities = _build_opportunities(columns, min_spread_pct=min_spread_pct, top_n=top_n)
     return ArbitrageResult(best_buy, best_sell, spread_abs, spread_pct, opportunities)
 
 
-def _filter_valid(quotes: Iterable[dict[str, object]], only_ws: bool) -> list[QuoteSnapshot]:
-    valid: list[QuoteSnapshot] = []
+def _filter_valid(quotes: Iterable[dict[str, object]], only_ws: bool) -> QuoteColumns:
+    columns = QuoteColumns([], [], [], [], [], [])
     for quote in quotes:
         status = str(quote.get("status", "")).upper()
         if status != "OK":
@@ -74,43 +100,46 @@ def _filter_valid(quotes: Iterable[dict[str, object]], only_ws: bool) -> list[Qu
         source = str(quote.get("source", "HTTP") or "HTTP").upper()
         if only_ws and source != "WS":
             continue
-        valid.append(
-            QuoteSnapshot(
-                exchange=str(quote.get("exchange", "")),
-                bid=bid,
-                ask=ask,
-                last=float(quote.get("last", 0.0) or 0.0),
-                status=status,
-                timestamp=str(quote.get("timestamp", "")),
-                source=source,
-            )
-        )
-    return valid
+        columns.exchanges.append(str(quote.get("exchange", "")))
+        columns.bids.append(bid)
+        columns.asks.append(ask)
+        columns.lasts.append(float(quote.get("last", 0.0) or 0.0))
+        columns.timestamps.append(str(quote.get("timestamp", "")))
+        columns.sources.append(source)
+    return columns
 
 
 def _build_opportunities(
-    quotes: list[QuoteSnapshot],
+    columns: QuoteColumns,
     min_spread_pct: float,
     top_n: int,
 ) -> list[Opportunity]:
-    opportunities: list[Opportunity] = []
-    for buy in quotes:
-        for sell in quotes:
-            if buy.exchange == sell.exchange:
+    # Candidates stay plain tuples; Opportunity objects are only
+    # materialized for the rows that survive the top_n cut.
+    exchanges = columns.exchanges
+    asks = columns.asks
+    bids = columns.bids
+    candidates: list[tuple[float, float, int, int]] = []
+    for buy_index, buy_ask in enumerate(asks):
+        buy_exchange = exchanges[buy_index]
+        for sell_index, sell_bid in enumerate(bids):
+            if exchanges[sell_index] == buy_exchange:
                 continue
-            spread_abs = sell.bid - buy.ask
-            spread_pct = (spread_abs / buy.ask * 100.0) if buy.ask else 0.0
+            spread_abs = sell_bid - buy_ask
+            # _filter_valid only keeps quotes with a positive ask.
+            spread_pct = spread_abs / buy_ask * 100.0
             if spread_pct < min_spread_pct:
                 continue
-            opportunities.append(
-                Opportunity(
-                    buy_exchange=buy.exchange,
-                    buy_ask=buy.ask,
-                    sell_exchange=sell.exchange,
-                    sell_bid=sell.bid,
-                    spread_abs=spread_abs,
-                    spread_pct=spread_pct,
-                )
-            )
-    opportunities.sort(key=lambda item: item.spread_pct, reverse=True)
-    return opportunities[:top_n]
+            candidates.append((spread_pct, spread_abs, buy_index, sell_index))
+    top = heapq.nlargest(top_n, candidates, key=itemgetter(0))
+    return [
+        Opportunity(
+            buy_exchange=exchanges[buy_index],
+            buy_ask=asks[buy_index],
+            sell_exchange=exchanges[sell_index],
+            sell_bid=bids[sell_index],
+            spread_abs=spread_abs,
+            spread_pct=spread_pct,
+        )
+        for spread_pct, spread_abs, buy_index, sell_index in top
+    ]
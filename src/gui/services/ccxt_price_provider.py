@@ -5,10 +5,22 @@ from __future__ import annotations
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any
+import threading
+from typing import Any, Callable
 
 import ccxt
+import httpx
 from loguru import logger
+import requests
+from requests.adapters import HTTPAdapter
+
+MARKET_WARMUP_WORKERS = 2
+
+# Shared by every provider instance (main window and each pair window), so
+# opening more windows does not add more warmup threads.
+_MARKET_WARMUP_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MARKET_WARMUP_WORKERS, thread_name_prefix="market-warmup"
+)
 
 
 @dataclass(frozen=True)
@@ -19,6 +31,35 @@ class ExchangeDefinition:
     ccxt_id: str
 
 
+@dataclass(frozen=True)
+class RawTickerEndpoint:
+    """Public REST ticker endpoint read without ccxt's ticker parsing."""
+
+    url: str
+    symbol_param: str
+    parse: Callable[[Any], tuple[float, float, float]]
+    params: tuple[tuple[str, str], ...] = ()
+
+
+def _price(ticker: Any, key: str) -> float:
+    # Empty or missing sides read as 0.0, matching the ccxt fetch_ticker path.
+    return float(ticker.get(key) or 0.0)
+
+
+def _parse_binance_ticker(payload: Any) -> tuple[float, float, float]:
+    return _price(payload, "bidPrice"), _price(payload, "askPrice"), _price(payload, "lastPrice")
+
+
+def _parse_okx_ticker(payload: Any) -> tuple[float, float, float]:
+    ticker = payload["data"][0]
+    return _price(ticker, "bidPx"), _price(ticker, "askPx"), _price(ticker, "last")
+
+
+def _parse_bybit_ticker(payload: Any) -> tuple[float, float, float]:
+    ticker = payload["result"]["list"][0]
+    return _price(ticker, "bid1Price"), _price(ticker, "ask1Price"), _price(ticker, "lastPrice")
+
+
 class CcxtPriceProvider:
     """Fetch quotes from top exchanges via ccxt."""
 
@@ -26,7 +67,24 @@ class CcxtPriceProvider:
     REVERSE_PAIR = "USDC/USDT"
     NO_SYMBOL_COOLDOWN = timedelta(seconds=60)
     ERROR_COOLDOWN = timedelta(seconds=12)
-    MARKET_WARMUP_WORKERS = 2
+    RAW_TICKER_TIMEOUT = 10
+    HTTP_POOL_SIZE = 32
+    # Exchanges whose ticker is read straight from REST: one JSON decode and
+    # three floats instead of ccxt's Python-level parse_ticker on every poll.
+    _RAW_TICKERS: dict[str, RawTickerEndpoint] = {
+        "Binance": RawTickerEndpoint(
+            "https://api.binance.com/api/v3/ticker/24hr", "symbol", _parse_binance_ticker
+        ),
+        "OKX": RawTickerEndpoint(
+            "https://www.okx.com/api/v5/market/ticker", "instId", _parse_okx_ticker
+        ),
+        "Bybit": RawTickerEndpoint(
+            "https://api.bybit.com/v5/market/tickers",
+            "symbol",
+            _parse_bybit_ticker,
+            (("category", "spot"),),
+        ),
+    }
     _EXCHANGES = [
         ExchangeDefinition("Binance", "binance"),
         ExchangeDefinition("Coinbase", "coinbase"),
@@ -41,11 +99,27 @@ class CcxtPriceProvider:
     ]
 
     def __init__(self) -> None:
+        # One pooled session for every ccxt client keeps TLS connections warm
+        # across polls, including while exchanges are fetched in parallel.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.HTTP_POOL_SIZE,
+                pool_maxsize=self.HTTP_POOL_SIZE,
+                max_retries=0,
+            ),
+        )
         self._exchanges: dict[str, ccxt.Exchange] = {}
         for definition in self._EXCHANGES:
             exchange_class = getattr(ccxt, definition.ccxt_id)
-            self._exchanges[definition.name] = exchange_class({"enableRateLimit": True})
+            self._exchanges[definition.name] = exchange_class(
+                {"enableRateLimit": True, "session": self._session}
+            )
         self._markets_loaded: set[str] = set()
+        # Pair windows share one provider, so WS bootstrap threads and the
+        # warmup pool can reach the same ccxt client at once.
+        self._market_locks = {definition.name: threading.Lock() for definition in self._EXCHANGES}
         self._market_futures: dict[str, Future[None]] = {}
         self._market_loading_since: dict[str, datetime] = {}
         self._market_retry_after: dict[str, datetime] = {}
@@ -55,7 +129,12 @@ class CcxtPriceProvider:
         self._error_cooldown_until: dict[str, datetime] = {}
         self._last_error: dict[str, str] = {}
         self._last_error_logged_at: dict[str, datetime] = {}
-        self._executor = ThreadPoolExecutor(max_workers=self.MARKET_WARMUP_WORKERS)
+        self._http = httpx.Client(timeout=self.RAW_TICKER_TIMEOUT)
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self._http.close()
+        self._session.close()
 
     def supported_exchanges(self) -> list[str]:
         return [definition.name for definition in self._EXCHANGES]
@@ -67,14 +146,9 @@ class CcxtPriceProvider:
             return None, "Unsupported exchange"
         now = datetime.now()
         if exchange_name not in self._markets_loaded:
-            try:
-                exchange.load_markets()
-            except ccxt.BaseError as exc:
-                message = str(exc)
-                self._error_cooldown_until[exchange_name] = now + self.ERROR_COOLDOWN
-                self._log_exchange_error(exchange_name, message)
+            message = self._load_markets(exchange_name, exchange, now)
+            if message is not None:
                 return None, message
-            self._markets_loaded.add(exchange_name)
         symbol, status, error = self._resolve_symbol(exchange_name, exchange, pair, now)
         if status in {"ERROR", "NO_SYMBOL"} or not symbol:
             return None, error or "Symbol resolution error"
@@ -91,121 +165,147 @@ class CcxtPriceProvider:
             return None, False, "Unsupported exchange"
         now = datetime.now()
         if exchange_name not in self._markets_loaded:
+            message = self._load_markets(exchange_name, exchange, now)
+            if message is not None:
+                return None, False, message
+        symbol, status, error = self._resolve_symbol(exchange_name, exchange, pair, now)
+        if status in {"ERROR", "NO_SYMBOL"} or not symbol:
+            return None, False, error or "Symbol resolution error"
+        return symbol, symbol == self.REVERSE_PAIR, None
+
+    def _load_markets(self, exchange_name: str, exchange: ccxt.Exchange, now: datetime) -> str | None:
+        """Load markets synchronously; returns the error message on failure."""
+        with self._market_locks[exchange_name]:
+            if exchange_name in self._markets_loaded:
+                return None
             try:
                 exchange.load_markets()
             except ccxt.BaseError as exc:
                 message = str(exc)
                 self._error_cooldown_until[exchange_name] = now + self.ERROR_COOLDOWN
                 self._log_exchange_error(exchange_name, message)
-                return None, False, message
+                return message
             self._markets_loaded.add(exchange_name)
-        symbol, status, error = self._resolve_symbol(exchange_name, exchange, pair, now)
-        if status in {"ERROR", "NO_SYMBOL"} or not symbol:
-            return None, False, error or "Symbol resolution error"
-        return symbol, symbol == self.REVERSE_PAIR, None
+        return None
+
+    def _load_markets_locked(self, exchange_name: str, exchange: ccxt.Exchange) -> None:
+        with self._market_locks[exchange_name]:
+            exchange.load_markets()
 
     def fetch_quotes(self, pair: str, exchanges: list[str]) -> list[dict[str, Any]]:
+        now = self.poll_markets()
+        return [self.fetch_one(pair, exchange_name, now) for exchange_name in exchanges]
+
+    def poll_markets(self) -> datetime:
+        """Collect finished market warmups; call once before a batch of fetch_one."""
         self._poll_market_futures()
-        now = datetime.now()
+        return datetime.now()
+
+    def fetch_one(self, pair: str, exchange_name: str, now: datetime) -> dict[str, Any]:
+        """Fetch a single exchange quote; safe to run concurrently per exchange."""
         timestamp = now.strftime("%H:%M:%S")
-        quotes: list[dict[str, Any]] = []
-        for exchange_name in exchanges:
-            exchange = self._exchanges.get(exchange_name)
-            if exchange is None:
-                quotes.append(
-                    self._format_quote(
-                        exchange_name,
-                        pair,
-                        timestamp,
-                        status="ERROR",
-                        error="Unsupported exchange",
-                    )
+        exchange = self._exchanges.get(exchange_name)
+        if exchange is None:
+            return self._format_quote(
+                exchange_name,
+                pair,
+                timestamp,
+                status="ERROR",
+                error="Unsupported exchange",
+            )
+
+        try:
+            if exchange_name not in self._markets_loaded:
+                status, error = self._ensure_markets_async(exchange_name, exchange, now)
+                return self._format_quote(
+                    exchange_name,
+                    pair,
+                    timestamp,
+                    status=status,
+                    error=error,
                 )
-                continue
 
-            try:
-                if exchange_name not in self._markets_loaded:
-                    status, error = self._ensure_markets_async(exchange_name, exchange, now)
-                    quotes.append(
-                        self._format_quote(
-                            exchange_name,
-                            pair,
-                            timestamp,
-                            status=status,
-                            error=error,
-                        )
-                    )
-                    continue
-
-                cooldown_message = self._cooldown_message(exchange_name, now)
-                if cooldown_message:
-                    quotes.append(
-                        self._format_quote(
-                            exchange_name,
-                            pair,
-                            timestamp,
-                            status="ERROR",
-                            error=cooldown_message,
-                        )
-                    )
-                    continue
-
-                symbol, status, error = self._resolve_symbol(exchange_name, exchange, pair, now)
-                if status == "NO_SYMBOL":
-                    quotes.append(
-                        self._format_quote(
-                            exchange_name,
-                            pair,
-                            timestamp,
-                            status="NO_SYMBOL",
-                            error=error or f"{pair} not listed",
-                        )
-                    )
-                    continue
-                if status == "ERROR" or not symbol:
-                    quotes.append(
-                        self._format_quote(
-                            exchange_name,
-                            pair,
-                            timestamp,
-                            status="ERROR",
-                            error=error or "Symbol resolution error",
-                        )
-                    )
-                    continue
-
-                ticker = exchange.fetch_ticker(symbol)
-                bid = float(ticker.get("bid") or 0.0)
-                ask = float(ticker.get("ask") or 0.0)
-                last = float(ticker.get("last") or 0.0)
-                spread = (ask - bid) if bid and ask else 0.0
-                quotes.append(
-                    self._format_quote(
-                        exchange_name,
-                        symbol,
-                        timestamp,
-                        bid=bid,
-                        ask=ask,
-                        last=last,
-                        spread=spread,
-                        status="OK",
-                    )
+            cooldown_message = self._cooldown_message(exchange_name, now)
+            if cooldown_message:
+                return self._format_quote(
+                    exchange_name,
+                    pair,
+                    timestamp,
+                    status="ERROR",
+                    error=cooldown_message,
                 )
-            except ccxt.BaseError as exc:
-                message = str(exc)
-                self._error_cooldown_until[exchange_name] = now + self.ERROR_COOLDOWN
-                self._log_exchange_error(exchange_name, message)
-                status = "TIMEOUT" if isinstance(exc, ccxt.RequestTimeout) else "ERROR"
-                quotes.append(
-                    self._format_quote(
-                        exchange_name,
-                        pair,
-                        timestamp,
-                        status=status,
-                        error=message,
-                    )
+
+            symbol, status, error = self._resolve_symbol(exchange_name, exchange, pair, now)
+            if status == "NO_SYMBOL":
+                return self._format_quote(
+                    exchange_name,
+                    pair,
+                    timestamp,
+                    status="NO_SYMBOL",
+                    error=error or f"{pair} not listed",
                 )
-        return quotes
+            if status == "ERROR" or not symbol:
+                return self._format_quote(
+                    exchange_name,
+                    pair,
+                    timestamp,
+                    status="ERROR",
+                    error=error or "Symbol resolution error",
+                )
+
+            bid, ask, last = self._fetch_ticker_prices(exchange_name, exchange, symbol)
+            spread = (ask - bid) if bid and ask else 0.0
+            return self._format_quote(
+                exchange_name,
+                symbol,
+                timestamp,
+                bid=bid,
+                ask=ask,
+                last=last,
+                spread=spread,
+                status="OK",
+            )
+        except ccxt.BaseError as exc:
+            message = str(exc)
+            self._error_cooldown_until[exchange_name] = now + self.ERROR_COOLDOWN
+            self._log_exchange_error(exchange_name, message)
+            status = "TIMEOUT" if isinstance(exc, ccxt.RequestTimeout) else "ERROR"
+            return self._format_quote(
+                exchange_name,
+                pair,
+                timestamp,
+                status=status,
+                error=message,
+            )
+
+    def _fetch_ticker_prices(
+        self,
+        exchange_name: str,
+        exchange: ccxt.Exchange,
+        symbol: str,
+    ) -> tuple[float, float, float]:
+        endpoint = self._RAW_TICKERS.get(exchange_name)
+        if endpoint is None:
+            ticker = exchange.fetch_ticker(symbol)
+            return (
+                float(ticker.get("bid") or 0.0),
+                float(ticker.get("ask") or 0.0),
+                float(ticker.get("last") or 0.0),
+            )
+        params = dict(endpoint.params)
+        params[endpoint.symbol_param] = exchange.market(symbol)["id"]
+        # Raw requests bypass ccxt's fetch2, so apply its rate limiter here.
+        if exchange.enableRateLimit:
+            exchange.throttle()
+        exchange.set_last_rest_request_timestamp()
+        try:
+            response = self._http.get(endpoint.url, params=params)
+            response.raise_for_status()
+            return endpoint.parse(response.json())
+        except httpx.TimeoutException as exc:
+            raise ccxt.RequestTimeout(f"{exchange_name} ticker timeout: {exc}") from exc
+        except (httpx.HTTPError, KeyError, IndexError, TypeError, ValueError) as exc:
+            raise ccxt.ExchangeError(f"{exchange_name} ticker error: {exc}") from exc
 
     def _poll_market_futures(self) -> None:
         for exchange_name, future in list(self._market_futures.items()):
@@ -242,7 +342,9 @@ class CcxtPriceProvider:
 
         if exchange_name not in self._market_futures:
             self._market_loading_since[exchange_name] = now
-            self._market_futures[exchange_name] = self._executor.submit(exchange.load_markets)
+            self._market_futures[exchange_name] = _MARKET_WARMUP_EXECUTOR.submit(
+                self._load_markets_locked, exchange_name, exchange
+            )
         return "LOADING", "Loading markets"
 
     def _resolve_symbol(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import threading
-from typing import Callable
+from typing import Callable, Iterable
 
 from loguru import logger
 
@@ -55,7 +55,7 @@ class WsManager:
         provider = self._PROVIDERS.get(exchange_name)
         return bool(provider and provider.ENABLED)
 
-    def start_for_selected_exchanges(self, pair: str, exchanges: list[str]) -> None:
+    def start_for_selected_exchanges(self, pair: str, exchanges: Iterable[str]) -> None:
         self.stop_all()
         self._startup_stop_event = threading.Event()
 
@@ -16,13 +16,13 @@ from PySide6.QtWidgets import (
 class ExchangeSelectorDialog(QDialog):
     """Selectable list of exchanges."""
 
-    def __init__(self, exchanges: list[str], selected: set[str], parent=None) -> None:
+    def __init__(self, exchanges: list[str], selected: frozenset[str] | set[str], parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Select Exchanges")
         self._checkboxes: dict[str, QCheckBox] = {}
         self._build_ui(exchanges, selected)
 
-    def _build_ui(self, exchanges: list[str], selected: set[str]) -> None:
+    def _build_ui(self, exchanges: list[str], selected: frozenset[str] | set[str]) -> None:
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Choose exchanges to include in the feed:"))
 
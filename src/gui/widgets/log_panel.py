@@ -8,6 +8,27 @@ from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import QPlainTextEdit
 
 
+def _make_formats(color: str) -> tuple[QTextCharFormat, QTextCharFormat]:
+    prefix_format = QTextCharFormat()
+    prefix_format.setForeground(QColor(color))
+    prefix_format.setFontWeight(QFont.Bold)
+    message_format = QTextCharFormat()
+    message_format.setForeground(QColor(color))
+    return prefix_format, message_format
+
+
+# Built once: every log line reuses its level's formats instead of parsing
+# a hex colour and allocating two QTextCharFormat objects.
+_SUCCESS_FORMATS = _make_formats("#48bb78")
+_LEVEL_FORMATS = {
+    "success": _SUCCESS_FORMATS,
+    "ok": _SUCCESS_FORMATS,
+    "warning": _make_formats("#f6e05e"),
+    "error": _make_formats("#f56565"),
+}
+_DEFAULT_FORMATS = _make_formats("#e2e8f0")
+
+
 class LogPanel(QPlainTextEdit):
     """Read-only log display with colored levels."""
 
@@ -18,25 +39,22 @@ class LogPanel(QPlainTextEdit):
         self.setStyleSheet("background-color: #0b0f14; color: #e2e8f0;")
 
     def append_log(self, level: str, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        level_text = level.upper()
-        prefix = f"[{timestamp}] [{level_text}] "
-        color = self._color_for_level(level_text)
-        self._append_colored_text(prefix, message, color)
+        self.append_log_batch([(level, message)])
 
-    def _append_colored_text(self, prefix: str, message: str, color: QColor) -> None:
+    def append_log_batch(self, entries: list[tuple[str, str]]) -> None:
+        """Append several ``(level, message)`` lines with one scroll update."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
         scroll_bar = self.verticalScrollBar()
         previous_value = scroll_bar.value()
         was_at_bottom = previous_value >= scroll_bar.maximum()
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.End)
-        prefix_format = QTextCharFormat()
-        prefix_format.setForeground(color)
-        prefix_format.setFontWeight(QFont.Bold)
-        message_format = QTextCharFormat()
-        message_format.setForeground(color)
-        cursor.insertText(prefix, prefix_format)
-        cursor.insertText(message + "\n", message_format)
+        cursor.beginEditBlock()
+        for level, message in entries:
+            level_text = level.upper()
+            prefix = f"[{timestamp}] [{level_text}] "
+            self._insert_colored_text(cursor, prefix, message, self._formats_for_level(level))
+        cursor.endEditBlock()
         if was_at_bottom:
             self.setTextCursor(cursor)
             self.ensureCursorVisible()
@@ -44,12 +62,16 @@ class LogPanel(QPlainTextEdit):
             scroll_bar.setValue(previous_value)
 
     @staticmethod
-    def _color_for_level(level: str) -> QColor:
-        normalized = level.lower()
-        if normalized in {"success", "ok"}:
-            return QColor("#48bb78")
-        if normalized == "warning":
-            return QColor("#f6e05e")
-        if normalized == "error":
-            return QColor("#f56565")
-        return QColor("#e2e8f0")
+    def _insert_colored_text(
+        cursor: QTextCursor,
+        prefix: str,
+        message: str,
+        formats: tuple[QTextCharFormat, QTextCharFormat],
+    ) -> None:
+        prefix_format, message_format = formats
+        cursor.insertText(prefix, prefix_format)
+        cursor.insertText(message + "\n", message_format)
+
+    @staticmethod
+    def _formats_for_level(level: str) -> tuple[QTextCharFormat, QTextCharFormat]:
+        return _LEVEL_FORMATS.get(level.lower(), _DEFAULT_FORMATS)
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from statistics import median
 import time
 from typing import Iterable
 
 import ccxt
+import ccxt.async_support as ccxt_async
 
-from ..core.update_controller import http_slot
+from ..core.update_controller import MAX_HTTP_CONCURRENCY, async_http_slot, http_slot
 
 logger = logging.getLogger(__name__)
 
+# Shared by every scan so per-exchange fetches reuse the same threads
+# instead of spinning up a pool inside each update-controller job.
+_SCAN_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_HTTP_CONCURRENCY, thread_name_prefix="ticker-scan"
+)
+
 
 @dataclass(frozen=True)
 class TickerScanUpdate:
@@ -77,6 +86,12 @@ class TickerScanService:
     _symbol_last_fetch: dict[tuple[str, str], float] = {}
     _exchange_offsets: dict[str, int] = {}
 
+    def __init__(self) -> None:
+        # Clients live as long as the service so repeated scans and pair
+        # fetches reuse their loaded markets and HTTP sessions.
+        self._exchanges: dict[str, ccxt.Exchange] = {}
+        self._async_exchanges: dict[str, ccxt_async.Exchange] = {}
+
     def scan(
         self,
         pair_exchanges: dict[str, list[str]],
@@ -93,7 +108,6 @@ class TickerScanService:
             pairs_to_scan = list(pairs)[:max_pairs]
         if outlier_pct is None:
             outlier_pct = self._default_outlier_pct
-        exchanges_cache: dict[str, ccxt.Exchange] = {}
         exchange_symbols: dict[str, set[str]] = {}
         ticker_map: dict[tuple[str, str], dict] = {}
         updates: list[TickerScanUpdate] = []
@@ -106,65 +120,41 @@ class TickerScanService:
             for exchange_label in pair_exchanges.get(pair, []):
                 exchange_symbols.setdefault(exchange_label, set()).add(pair)
 
+        jobs: list[tuple[str, ccxt.Exchange, list[str]]] = []
         for exchange_label, symbols in exchange_symbols.items():
             exchange_id = self._exchange_map.get(exchange_label, exchange_label.lower())
             if not hasattr(ccxt, exchange_id):
                 continue
-            exchange = exchanges_cache.get(exchange_id)
-            if exchange is None:
-                exchange = getattr(ccxt, exchange_id)(
-                    {"enableRateLimit": True, "timeout": self._timeout_ms}
+            jobs.append((exchange_label, self._sync_exchange(exchange_id), sorted(symbols)))
+
+        # Exchanges are independent, so their requests overlap and the fetch
+        # phase costs roughly the slowest exchange rather than the sum of all
+        # of them; http_slot() still caps the number of requests in flight.
+        if len(jobs) > 1:
+            fetched = list(
+                _SCAN_EXECUTOR.map(
+                    lambda job: self._fetch_exchange_tickers(*job, now), jobs
                 )
-                if exchange_id == "binance":
-                    options = getattr(exchange, "options", None)
-                    if not isinstance(options, dict):
-                        exchange.options = {}
-                    exchange.options["defaultType"] = "spot"
-                exchanges_cache[exchange_id] = exchange
-            symbol_list = sorted(symbols)
-            due_symbols = [
-                symbol
-                for symbol in symbol_list
-                if self._is_symbol_due(exchange_label, symbol, now)
-            ]
-            if exchange.has.get("fetchTickers"):
-                if not due_symbols:
-                    continue
-                try:
-                    with http_slot():
-                        tickers = exchange.fetch_tickers(due_symbols)
-                except Exception as exc:  # noqa: BLE001 - per-exchange errors are expected
-                    fail_count += 1
-                    message = f"Ticker error: {exchange_label} batch: {exc}"
-                    errors.append(message)
-                    logger.warning(message)
-                    continue
-                for symbol in due_symbols:
-                    ticker = tickers.get(symbol)
-                    if ticker is None:
-                        continue
-                    self._mark_symbol_fetched(exchange_label, symbol, now)
-                    ticker_map[(symbol, exchange_label)] = ticker
-                    ok_count += 1
-                continue
+            )
+        else:
+            fetched = [self._fetch_exchange_tickers(*job, now) for job in jobs]
 
-            batch = self._select_symbol_batch(exchange_label, due_symbols)
-            if not batch:
-                continue
-            for symbol in batch:
-                try:
-                    with http_slot():
-                        ticker = exchange.fetch_ticker(symbol)
-                    ok_count += 1
-                except Exception as exc:  # noqa: BLE001 - per-exchange errors are expected
-                    fail_count += 1
-                    message = f"Ticker error: {exchange_label} {symbol}: {exc}"
-                    errors.append(message)
-                    logger.warning(message)
-                    continue
-                self._mark_symbol_fetched(exchange_label, symbol, now)
+        for (exchange_label, _exchange, _symbols), (tickers, exchange_errors) in zip(
+            jobs, fetched
+        ):
+            for symbol, ticker in tickers.items():
                 ticker_map[(symbol, exchange_label)] = ticker
-
+            ok_count += len(tickers)
+            fail_count += len(exchange_errors)
+            errors.extend(exchange_errors)
+
+        # Thresholds are turned into multipliers once per scan so the
+        # per-ticker checks below multiply instead of dividing by each mid:
+        # (ask - bid) / mid * 100 > max  <=>  ask - bid > max / 200 * (bid + ask).
+        intrabook_ratio = (
+            max_intrabook_spread_pct / 200 if max_intrabook_spread_pct is not None else None
+        )
+        outlier_ratio = outlier_pct / 100
         for pair in pairs_to_scan:
             entries: list[tuple[str, float, float, float, float | None]] = []
             for exchange_label in pair_exchanges.get(pair, []):
@@ -175,42 +165,26 @@ class TickerScanService:
                 ask = _as_float(ticker.get("ask"))
                 if bid is None or ask is None or bid <= 0 or ask <= 0:
                     continue
-                mid = (bid + ask) / 2
-                if max_intrabook_spread_pct is not None:
-                    intrabook = (ask - bid) / mid * 100
-                    if intrabook > max_intrabook_spread_pct:
-                        continue
+                if intrabook_ratio is not None and ask - bid > intrabook_ratio * (bid + ask):
+                    continue
                 volume = _pick_volume(ticker)
-                entries.append((exchange_label, bid, ask, mid, volume))
+                entries.append((exchange_label, bid, ask, (bid + ask) / 2, volume))
 
             if len(entries) < 2:
                 skipped_count += 1
                 continue
 
-            mids = [entry[3] for entry in entries]
-            median_mid = median(mids)
-            valid_entries: list[tuple[str, float, float, float, float | None]] = []
-            for entry in entries:
-                mid = entry[3]
-                if abs(mid - median_mid) / median_mid * 100 > outlier_pct:
-                    continue
-                valid_entries.append(entry)
+            median_mid = median([entry[3] for entry in entries])
+            outlier_limit = median_mid * outlier_ratio
+            valid_entries = [
+                entry for entry in entries if abs(entry[3] - median_mid) <= outlier_limit
+            ]
 
             if len(valid_entries) < 2:
                 skipped_count += 1
                 continue
 
-            asks: list[tuple[float, str]] = []
-            bids: list[tuple[float, str]] = []
-            volumes: list[float] = []
-            for exchange_label, bid, ask, _mid, volume in valid_entries:
-                bids.append((bid, exchange_label))
-                asks.append((ask, exchange_label))
-                if volume is not None:
-                    volumes.append(volume)
-
-            update = _build_update(pair, bids, asks, volumes)
-            updates.append(update)
+            updates.append(_build_update(pair, valid_entries))
 
         return TickerScanResult(
             updates=updates,
@@ -221,73 +195,154 @@ class TickerScanService:
             errors=errors,
         )
 
-    def fetch_pair_tickers(
-        self, pair: str, exchanges: Iterable[str]
-    ) -> tuple[list[PairExchangeTicker], list[str]]:
-        """Fetch tickers for a single pair across the selected exchanges."""
-        entries: list[PairExchangeTicker] = []
+    def _fetch_exchange_tickers(
+        self,
+        exchange_label: str,
+        exchange: ccxt.Exchange,
+        symbol_list: list[str],
+        now: float,
+    ) -> tuple[dict[str, dict], list[str]]:
+        """Fetch the due symbols of one exchange; returns tickers and errors."""
+        tickers: dict[str, dict] = {}
         errors: list[str] = []
-        exchanges_cache: dict[str, ccxt.Exchange] = {}
-        now = time.monotonic()
-        for exchange_label in exchanges:
-            exchange_id = self._exchange_map.get(exchange_label, exchange_label.lower())
-            if not hasattr(ccxt, exchange_id):
-                errors.append(f"Exchange not found: {exchange_label}")
-                entries.append(
-                    PairExchangeTicker(
-                        exchange=exchange_label,
-                        bid=None,
-                        ask=None,
-                        volume_24h=None,
-                        status="NO API",
-                    )
-                )
-                continue
-            exchange = exchanges_cache.get(exchange_id)
-            if exchange is None:
-                exchange = getattr(ccxt, exchange_id)(
-                    {"enableRateLimit": True, "timeout": self._timeout_ms}
-                )
-                if exchange_id == "binance":
-                    options = getattr(exchange, "options", None)
-                    if not isinstance(options, dict):
-                        exchange.options = {}
-                    exchange.options["defaultType"] = "spot"
-                exchanges_cache[exchange_id] = exchange
+        due_symbols = [
+            symbol
+            for symbol in symbol_list
+            if self._is_symbol_due(exchange_label, symbol, now)
+        ]
+        if exchange.has.get("fetchTickers"):
+            if not due_symbols:
+                return tickers, errors
             try:
                 with http_slot():
-                    ticker = exchange.fetch_ticker(pair)
+                    batch_tickers = exchange.fetch_tickers(due_symbols)
             except Exception as exc:  # noqa: BLE001 - per-exchange errors are expected
-                message = f"Ticker error: {exchange_label} {pair}: {exc}"
+                message = f"Ticker error: {exchange_label} batch: {exc}"
+                errors.append(message)
+                logger.warning(message)
+                return tickers, errors
+            for symbol in due_symbols:
+                ticker = batch_tickers.get(symbol)
+                if ticker is None:
+                    continue
+                self._mark_symbol_fetched(exchange_label, symbol, now)
+                tickers[symbol] = ticker
+            return tickers, errors
+
+        batch = self._select_symbol_batch(exchange_label, due_symbols)
+        for symbol in batch:
+            try:
+                with http_slot():
+                    ticker = exchange.fetch_ticker(symbol)
+            except Exception as exc:  # noqa: BLE001 - per-exchange errors are expected
+                message = f"Ticker error: {exchange_label} {symbol}: {exc}"
                 errors.append(message)
                 logger.warning(message)
-                entries.append(
-                    PairExchangeTicker(
-                        exchange=exchange_label,
-                        bid=None,
-                        ask=None,
-                        volume_24h=None,
-                        status="ERR",
-                    )
-                )
                 continue
-            self._mark_symbol_fetched(exchange_label, pair, now)
-            bid = _as_float(ticker.get("bid"))
-            ask = _as_float(ticker.get("ask"))
-            volume = _pick_volume(ticker)
-            status = "OK"
-            if bid is None or ask is None or bid <= 0 or ask <= 0:
-                status = "NO DATA"
-            entries.append(
+            self._mark_symbol_fetched(exchange_label, symbol, now)
+            tickers[symbol] = ticker
+        return tickers, errors
+
+    async def fetch_pair_tickers_async(
+        self, pair: str, exchanges: Iterable[str]
+    ) -> tuple[list[PairExchangeTicker], list[str]]:
+        """Fetch tickers for a single pair from all exchanges concurrently."""
+        now = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                self._fetch_pair_ticker_async(exchange_label, pair, now)
+                for exchange_label in exchanges
+            )
+        )
+        entries = [entry for entry, _error in results]
+        errors = [error for _entry, error in results if error]
+        return entries, errors
+
+    async def _fetch_pair_ticker_async(
+        self, exchange_label: str, pair: str, now: float
+    ) -> tuple[PairExchangeTicker, str | None]:
+        exchange_id = self._exchange_map.get(exchange_label, exchange_label.lower())
+        if not hasattr(ccxt_async, exchange_id):
+            return (
                 PairExchangeTicker(
                     exchange=exchange_label,
-                    bid=bid,
-                    ask=ask,
-                    volume_24h=volume,
-                    status=status,
-                )
+                    bid=None,
+                    ask=None,
+                    volume_24h=None,
+                    status="NO API",
+                ),
+                f"Exchange not found: {exchange_label}",
             )
-        return entries, errors
+        exchange = self._async_exchange(exchange_id)
+        try:
+            async with async_http_slot():
+                ticker = await exchange.fetch_ticker(pair)
+        except Exception as exc:  # noqa: BLE001 - per-exchange errors are expected
+            message = f"Ticker error: {exchange_label} {pair}: {exc}"
+            logger.warning(message)
+            return (
+                PairExchangeTicker(
+                    exchange=exchange_label,
+                    bid=None,
+                    ask=None,
+                    volume_24h=None,
+                    status="ERR",
+                ),
+                message,
+            )
+        self._mark_symbol_fetched(exchange_label, pair, now)
+        bid = _as_float(ticker.get("bid"))
+        ask = _as_float(ticker.get("ask"))
+        volume = _pick_volume(ticker)
+        status = "OK"
+        if bid is None or ask is None or bid <= 0 or ask <= 0:
+            status = "NO DATA"
+        return (
+            PairExchangeTicker(
+                exchange=exchange_label,
+                bid=bid,
+                ask=ask,
+                volume_24h=volume,
+                status=status,
+            ),
+            None,
+        )
+
+    async def aclose(self) -> None:
+        """Close the async exchange clients opened by pair fetches."""
+        exchanges = list(self._async_exchanges.values())
+        self._async_exchanges.clear()
+        await asyncio.gather(
+            *(exchange.close() for exchange in exchanges), return_exceptions=True
+        )
+
+    def _sync_exchange(self, exchange_id: str) -> ccxt.Exchange:
+        exchange = self._exchanges.get(exchange_id)
+        if exchange is None:
+            exchange = getattr(ccxt, exchange_id)(
+                {"enableRateLimit": True, "timeout": self._timeout_ms}
+            )
+            if exchange_id == "binance":
+                options = getattr(exchange, "options", None)
+                if not isinstance(options, dict):
+                    exchange.options = {}
+                exchange.options["defaultType"] = "spot"
+            self._exchanges[exchange_id] = exchange
+        return exchange
+
+    def _async_exchange(self, exchange_id: str) -> ccxt_async.Exchange:
+        exchange = self._async_exchanges.get(exchange_id)
+        if exchange is None:
+            exchange = getattr(ccxt_async, exchange_id)(
+                {"enableRateLimit": True, "timeout": self._timeout_ms}
+            )
+            if exchange_id == "binance":
+                options = getattr(exchange, "options", None)
+                if not isinstance(options, dict):
+                    exchange.options = {}
+                exchange.options["defaultType"] = "spot"
+            self._async_exchanges[exchange_id] = exchange
+        return exchange
 
     def _is_symbol_due(self, exchange_label: str, symbol: str, now: float) -> bool:
         last_ts = self._symbol_last_fetch.get((exchange_label, symbol))
@@ -324,24 +379,27 @@ def _pick_volume(ticker: dict) -> float | None:
 
 def _build_update(
     pair: str,
-    bids: Iterable[tuple[float, str]],
-    asks: Iterable[tuple[float, str]],
-    volumes: Iterable[float],
+    entries: Iterable[tuple[str, float, float, float, float | None]],
 ) -> TickerScanUpdate:
-    bids_list = list(bids)
-    asks_list = list(asks)
-    volumes_list = list(volumes)
     best_buy_exchange = None
     buy_ask = None
     best_sell_exchange = None
     sell_bid = None
     spread_abs = None
     spread_pct = None
-
-    if asks_list:
-        buy_ask, best_buy_exchange = min(asks_list, key=lambda item: item[0])
-    if bids_list:
-        sell_bid, best_sell_exchange = max(bids_list, key=lambda item: item[0])
+    volumes: list[float] = []
+
+    # One pass picks the lowest ask and highest bid without building
+    # (price, exchange) lists; ties keep the first exchange like min()/max().
+    for exchange_label, bid, ask, _mid, volume in entries:
+        if buy_ask is None or ask < buy_ask:
+            buy_ask = ask
+            best_buy_exchange = exchange_label
+        if sell_bid is None or bid > sell_bid:
+            sell_bid = bid
+            best_sell_exchange = exchange_label
+        if volume is not None:
+            volumes.append(volume)
 
     if buy_ask is not None and sell_bid is not None:
         spread_abs = sell_bid - buy_ask
@@ -349,7 +407,7 @@ def _build_update(
         if mid > 0:
             spread_pct = spread_abs / mid * 100
 
-    volume_24h = median(volumes_list) if volumes_list else None
+    volume_24h = median(volumes) if volumes else None
     return TickerScanUpdate(
         pair=pair,
         best_buy_exchange=best_buy_exchange,